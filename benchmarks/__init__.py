@@ -0,0 +1 @@
+"""Benchmarks for Ponsiv (run from the repository root, see README)."""
@@ -0,0 +1,103 @@
+import json
+import math
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+# Kivy sin ventana real: GL simulado + SDL offscreen, sin logs por consola
+HEADLESS_ENV = {
+    "KIVY_GL_BACKEND": "mock",
+    "SDL_VIDEODRIVER": "offscreen",
+    "KIVY_NO_ARGS": "1",
+    "KIVY_NO_CONSOLELOG": "1",
+    "KIVY_NO_FILELOG": "1",
+}
+
+# Prefijo de la línea con el resultado que imprime cada proceso hijo
+RESULT_MARKER = "BENCH_RESULT "
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of ``values`` (``pct`` in 0..100)."""
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def summarize(samples: Iterable[float]) -> Dict[str, float]:
+    values = list(samples)
+    return {
+        "n": len(values),
+        "median": statistics.median(values),
+        "mean": statistics.fmean(values),
+        "p90": percentile(values, 90),
+        "p95": percentile(values, 95),
+        "min": min(values),
+        "max": max(values),
+    }
+
+
+def summarize_runs(runs: List[Dict[str, float]]) -> Dict[str, Dict[str, float]]:
+    """Per-key summary of a list of ``{phase: seconds}`` dicts (keys in first-seen order)."""
+    keys = list(dict.fromkeys(k for run in runs for k in run))
+    return {k: summarize(run[k] for run in runs if k in run) for k in keys}
+
+
+def time_calls(fn: Callable, calls: Iterable[tuple]) -> Dict[str, float]:
+    """Call ``fn(*args)`` for every ``args`` in ``calls``; latency summary
+    (seconds) plus ``ops_per_sec`` over the whole loop."""
+    samples = []
+    clock = time.perf_counter
+    for args in calls:
+        start = clock()
+        fn(*args)
+        samples.append(clock() - start)
+    result = summarize(samples)
+    total = sum(samples)
+    result["ops_per_sec"] = len(samples) / total if total else 0.0
+    return result
+
+
+def git_commit() -> Optional[str]:
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=REPO_ROOT,
+                             capture_output=True, text=True, check=True)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return out.stdout.strip() or None
+
+
+def run_child(module: str, args: List[str], *, headless: bool = True,
+              timeout: float = 300.0) -> dict:
+    """Run ``python -m module args`` in a fresh process and return its result dict."""
+    env = dict(os.environ)
+    if headless:
+        for key, value in HEADLESS_ENV.items():
+            env.setdefault(key, value)
+    proc = subprocess.run([sys.executable, "-m", module, *args], cwd=REPO_ROOT, env=env,
+                          capture_output=True, text=True, timeout=timeout)
+    for line in reversed(proc.stdout.splitlines()):
+        if line.startswith(RESULT_MARKER):
+            return json.loads(line[len(RESULT_MARKER):])
+    raise RuntimeError(
+        f"{module} exited with {proc.returncode} without a result:\n{proc.stderr[-2000:]}"
+    )
+
+
+def emit_result(result: dict) -> None:
+    """Child side of :func:`run_child`."""
+    print(RESULT_MARKER + json.dumps(result), flush=True)
+
+
+def write_report(report: dict, output: Optional[str]) -> None:
+    text = json.dumps(report, indent=2)
+    if output:
+        Path(output).write_text(text + "\n", encoding="utf-8")
+    else:
+        print(text)
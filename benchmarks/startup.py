@@ -0,0 +1,187 @@
+"""Headless startup-time benchmark.
+
+Every run is a fresh ``python`` process (cold start) using Kivy's mock GL
+backend and SDL's offscreen driver. Each process times, separately:
+
+* ``import_kivy``      importing Kivy and creating the (offscreen) window
+* ``import_app``       importing ``ponsiv.main`` (KivyMD, chrome widgets)
+* ``store_init``       ``PonsivStore()``
+* ``migrations``       opening the database and running the migrations
+* ``load_seed``        loading the catalog
+* ``build``            ``PonsivApp.build`` minus the login screen's pre-enter
+* ``login_pre_enter``  first ``LoginScreen.on_pre_enter``
+* ``first_frame``      process start until the first frame is drawn
+* ``feed_pre_enter``   first ``FeedScreen.on_pre_enter``
+
+and the parent prints (or writes) JSON with the median, mean, p90, p95,
+min and max of every phase::
+
+    python -m benchmarks.startup --runs 20 --output startup.json
+
+The database is a temporary copy of ``ponsiv/users.db`` (or an empty one
+with ``--fresh-db``), so runs never modify the real one. The catalog
+snapshot and the thumbnail cache are built once, before the runs, in a
+temporary directory, so every run starts from the same state and the
+working tree is never written.
+"""
+import argparse
+import platform
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.common import (
+    REPO_ROOT, emit_result, git_commit, run_child, summarize_runs, write_report,
+)
+
+T0 = time.perf_counter()
+
+TIMED_SCREENS = ("login", "feed")
+
+
+def _child(args: argparse.Namespace) -> None:
+    phases = {}
+
+    def lap(name: str, start: float) -> float:
+        now = time.perf_counter()
+        phases[name] = now - start
+        return now
+
+    t = time.perf_counter()
+    from kivy.core.window import Window  # noqa: F401  (crea la ventana)
+    t = lap("import_kivy", t)
+    from kivy.clock import Clock
+    import ponsiv.main as app_main
+    from ponsiv import store as store_module
+    from ponsiv.screens.registry import LazyScreenManager
+    from ponsiv.thumbnails import thumbnails
+    t = lap("import_app", t)
+
+    # Miniaturas ya generadas por el proceso padre: warm_up no tiene nada que hacer
+    thumbnails.cache_dir = Path(args.thumbs)
+    instance = store_module.PonsivStore()
+    instance.db_path = Path(args.db)
+    t = lap("store_init", t)
+    instance.db
+    t = lap("migrations", t)
+    instance.load_seed(use_snapshot=not args.no_snapshot, snapshot_path=Path(args.snapshot))
+    lap("load_seed", t)
+    # La app usará este store en vez de crear (y cargar) otro
+    store_module._store = instance
+
+    # Mide el primer on_pre_enter de las pantallas elegidas al crearlas
+    pre_enter = {}
+    original_get_screen = LazyScreenManager.get_screen
+
+    def get_screen(self, name):
+        built = self.is_built(name)
+        screen = original_get_screen(self, name)
+        if not built and name in TIMED_SCREENS:
+            handler = screen.on_pre_enter
+
+            def timed(*a, _handler=handler, _name=name):
+                if _name in pre_enter:
+                    return _handler(*a)
+                start = time.perf_counter()
+                result = _handler(*a)
+                pre_enter[_name] = time.perf_counter() - start
+                return result
+
+            screen.on_pre_enter = timed
+        return screen
+
+    LazyScreenManager.get_screen = get_screen
+
+    class BenchApp(app_main.PonsivApp):
+        def build(self):
+            start = time.perf_counter()
+            root = super().build()
+            # La pantalla inicial entra durante build: se cuenta aparte
+            phases["build"] = time.perf_counter() - start - pre_enter.get("login", 0.0)
+            return root
+
+        def on_start(self):
+            Clock.schedule_once(self._first_frame, 0)
+
+        def _first_frame(self, _dt):
+            phases["first_frame"] = time.perf_counter() - T0
+            self.switch_screen("feed")
+            Clock.schedule_once(lambda _dt: self.stop(), 0)
+
+    BenchApp().run()
+    for name in TIMED_SCREENS:
+        if name in pre_enter:
+            phases[f"{name}_pre_enter"] = pre_enter[name]
+    emit_result(phases)
+
+
+def _prepare_caches(session: Path, snapshot: bool) -> tuple:
+    """Build the catalog snapshot and the thumbnails under ``session``."""
+    from ponsiv.catalog import ASSETS_PATH, load_products
+    from ponsiv.thumbnails import ThumbnailCache
+
+    snapshot_path = session / "catalog.snapshot"
+    products = load_products(ASSETS_PATH, snapshot_path if snapshot else None)
+    thumbs = session / "thumbs"
+    ThumbnailCache(thumbs).build(src for p in products for src in p.images[:1])
+    return snapshot_path, thumbs
+
+
+def _run(args: argparse.Namespace) -> dict:
+    source_db = REPO_ROOT / "ponsiv" / "users.db"
+    runs = []
+    with tempfile.TemporaryDirectory(prefix="ponsiv-bench-") as session:
+        snapshot, thumbs = _prepare_caches(Path(session), not args.no_snapshot)
+        for i in range(args.warmup + args.runs):
+            with tempfile.TemporaryDirectory(prefix="ponsiv-bench-run-") as tmp:
+                db = Path(tmp) / "users.db"
+                if not args.fresh_db and source_db.exists():
+                    shutil.copy2(source_db, db)
+                child_args = ["--child", "--db", str(db),
+                              "--snapshot", str(snapshot), "--thumbs", str(thumbs)]
+                if args.no_snapshot:
+                    child_args.append("--no-snapshot")
+                phases = run_child("benchmarks.startup", child_args)
+            if i >= args.warmup:
+                runs.append(phases)
+            if args.verbose:
+                label = "warmup" if i < args.warmup else f"run {i - args.warmup + 1}"
+                print(label, {k: round(v, 4) for k, v in phases.items()}, file=sys.stderr)
+    return {
+        "benchmark": "startup",
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "runs": args.runs,
+        "options": {"fresh_db": args.fresh_db, "no_snapshot": args.no_snapshot},
+        "unit": "seconds",
+        "phases": summarize_runs(runs),
+        "samples": runs,
+    }
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10, help="measured runs (default 10)")
+    parser.add_argument("--warmup", type=int, default=1, help="discarded runs first (default 1)")
+    parser.add_argument("--output", help="write the JSON report here instead of stdout")
+    parser.add_argument("--fresh-db", action="store_true",
+                        help="start from an empty database (all migrations run)")
+    parser.add_argument("--no-snapshot", action="store_true",
+                        help="parse every product JSON instead of using the catalog snapshot")
+    parser.add_argument("--verbose", action="store_true", help="print every run to stderr")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--db", help=argparse.SUPPRESS)
+    parser.add_argument("--snapshot", help=argparse.SUPPRESS)
+    parser.add_argument("--thumbs", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+    if args.child:
+        _child(args)
+    else:
+        write_report(_run(args), args.output)
+
+
+if __name__ == "__main__":
+    main()
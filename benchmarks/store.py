@@ -0,0 +1,227 @@
+"""Store-layer benchmarks on a synthetic catalog and user/like population.
+
+A dataset is generated with :mod:`benchmarks.synthetic` (or an existing one
+is reused with ``--data``) and the following are timed on a
+:class:`ponsiv.store.PonsivStore` pointed at it:
+
+* ``load_seed``                 full parse (no snapshot) and from the snapshot
+* ``like_counts_load``          first ``get_all_like_counts`` (reads ``like_counts``)
+* ``get_all_like_counts``       later calls (copy of the in-memory mirror)
+* ``get_products_by_category``  every category in turn
+* ``sort_products_by_likes``    one category and the whole catalog
+* ``toggle_like``               random user/product pairs, write-behind and
+                                synchronous, plus the write-behind flush (the
+                                users' likes are loaded first, as after login)
+* ``authenticate_user``         right password, wrong password, unknown email
+* ``explore``                   ``ExploreScreen._filter_and_rank`` with the
+                                filters the screen uses (first call separately,
+                                it loads the trending engine)
+
+Every result has latency percentiles (seconds) and ``ops_per_sec``::
+
+    python -m benchmarks.store --scale large --data /tmp/ponsiv-large --output store.json
+
+The database is copied before the run, so a kept dataset never changes.
+"""
+import argparse
+import os
+import platform
+import random
+import shutil
+import sys
+import tempfile
+import time
+from itertools import cycle, islice
+from pathlib import Path
+from typing import Dict, List
+
+from benchmarks import synthetic
+from benchmarks.common import (
+    HEADLESS_ENV, git_commit, summarize, summarize_runs, time_calls, write_report,
+)
+
+# Filtros de Explorar: (consulta, categorías, palabras clave)
+EXPLORE_CASES = {
+    "all": ("", None, ()),
+    "summer": ("", ("Vestidos", "Camisetas", "Tops", "Bermudas"), ()),
+    "category": ("", ("Vestidos",), ()),
+    "keywords": ("", None, ("lino", "denim")),
+    "query": ("cam", None, ()),
+    "query_words": ("vestido lino", None, ()),
+}
+
+
+def _new_store(db_path: Path, **kwargs):
+    from ponsiv.store import PonsivStore
+
+    instance = PonsivStore(**kwargs)
+    instance.db_path = db_path
+    return instance
+
+
+def _bench_load_seed(assets: Path, db_path: Path, snapshot: Path, runs: int) -> Dict[str, dict]:
+    results = {}
+    for name, use_snapshot in (("load_seed", False), ("load_seed_snapshot", True)):
+        if use_snapshot:
+            # La primera carga escribe el snapshot; no se cuenta
+            _new_store(db_path).load_seed(assets_path=assets, snapshot_path=snapshot)
+        samples, phases = [], []
+        for _ in range(runs):
+            instance = _new_store(db_path)
+            start = time.perf_counter()
+            instance.load_seed(use_snapshot=use_snapshot, assets_path=assets,
+                               snapshot_path=snapshot)
+            samples.append(time.perf_counter() - start)
+            phases.append(instance.seed_timings)
+        result = summarize(samples)
+        result["products_per_sec"] = len(instance.products) / result["median"]
+        result["phases"] = {k: v["median"] for k, v in summarize_runs(phases).items()}
+        results[name] = result
+    return results
+
+
+def _bench_like_counts(db_path: Path, runs: int) -> dict:
+    samples = []
+    for _ in range(runs):
+        instance = _new_store(db_path)
+        instance.db  # apertura y migraciones fuera de la medida
+        start = time.perf_counter()
+        instance.get_all_like_counts()
+        samples.append(time.perf_counter() - start)
+        instance.close()
+    return summarize(samples)
+
+
+def _warm(instance, user_ids=()) -> None:
+    """Load the like counts, the trending engine and the liked sets of
+    ``user_ids`` outside the measurements."""
+    instance.trending_products(products=[], k=1)
+    for uid in set(user_ids):
+        instance._liked_set(uid)
+
+
+def _bench_explore(instance, iterations: int) -> Dict[str, dict]:
+    for key, value in HEADLESS_ENV.items():
+        os.environ.setdefault(key, value)
+    from ponsiv import store as store_module
+    from ponsiv.screens.explore import ExploreScreen
+
+    # La pantalla filtra sobre el singleton: se usa el store del benchmark
+    store_module._store = instance
+    pipeline = ExploreScreen._filter_and_rank
+    start = time.perf_counter()
+    pipeline(*EXPLORE_CASES["summer"])
+    results = {"explore_first": time.perf_counter() - start}
+    for name, case in EXPLORE_CASES.items():
+        results[f"explore_{name}"] = time_calls(pipeline, [case] * iterations)
+    return results
+
+
+def _run(args: argparse.Namespace, data: Path, work: Path) -> dict:
+    info = synthetic.load_info(data)
+    assets = data / "assets"
+    db_path = work / "users.db"
+    shutil.copy2(data / "users.db", db_path)
+    rng = random.Random(args.seed + 1)
+    n = args.iterations
+    results: Dict[str, object] = {}
+
+    results.update(_bench_load_seed(assets, db_path, work / "catalog.snapshot", args.seed_runs))
+    results["like_counts_load"] = _bench_like_counts(db_path, args.seed_runs)
+
+    instance = _new_store(db_path)
+    instance.load_seed(assets_path=assets, snapshot_path=work / "catalog.snapshot")
+    categories = instance.get_categories()
+    products = list(instance.products.values())
+    product_ids = list(instance.products)
+    users = info["users"]
+
+    results["get_all_like_counts"] = time_calls(instance.get_all_like_counts, [()] * n)
+    results["get_products_by_category"] = time_calls(
+        instance.get_products_by_category, [(c,) for c in islice(cycle(categories), n)]
+    )
+    by_category = [instance.get_products_by_category(c) for c in categories]
+    results["sort_products_by_likes_category"] = time_calls(
+        instance.sort_products_by_likes, [(items,) for items in islice(cycle(by_category), n)]
+    )
+    results["sort_products_by_likes_all"] = time_calls(
+        instance.sort_products_by_likes, [(products,)] * args.seed_runs
+    )
+
+    # Antes de toggle_like, que también carga el motor de tendencias
+    if not args.no_explore:
+        results.update(_bench_explore(instance, n))
+
+    def pairs() -> List[tuple]:
+        return [(rng.randint(1, users), rng.choice(product_ids)) for _ in range(n)]
+
+    # Los likes de cada usuario se cargan al iniciar sesión, no en el primer toggle
+    toggles = pairs()
+    _warm(instance, (uid for uid, _ in toggles))
+    results["toggle_like"] = time_calls(instance.toggle_like, toggles)
+    results["toggle_like_flush"] = time_calls(instance.flush_likes, [()])
+    sync = _new_store(db_path, write_behind=False)
+    toggles = pairs()
+    _warm(sync, (uid for uid, _ in toggles))
+    results["toggle_like_sync"] = time_calls(sync.toggle_like, toggles)
+    sync.close()
+
+    emails = [(synthetic.user_email(rng.randrange(users)),) for _ in range(args.auth_iterations)]
+    results["authenticate_user"] = time_calls(
+        instance.authenticate_user, [(e, synthetic.PASSWORD) for (e,) in emails]
+    )
+    results["authenticate_user_wrong_password"] = time_calls(
+        instance.authenticate_user, [(e, "wrong-password") for (e,) in emails]
+    )
+    results["authenticate_user_unknown"] = time_calls(
+        instance.authenticate_user,
+        [(f"nobody{i}@{synthetic.EMAIL_DOMAIN}", synthetic.PASSWORD) for i in range(n)],
+    )
+
+    instance.close()
+
+    dataset = {k: v for k, v in info.items() if k != "categories"}
+    return {
+        "benchmark": "store",
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "dataset": dataset,
+        "options": {"iterations": n, "seed_runs": args.seed_runs,
+                    "auth_iterations": args.auth_iterations},
+        "unit": "seconds",
+        "results": results,
+    }
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    synthetic.add_scale_arguments(parser)
+    parser.add_argument("--data", help="dataset directory: reused if it exists, "
+                                       "otherwise generated there and kept")
+    parser.add_argument("--iterations", type=int, default=200,
+                        help="calls per fast operation (default 200)")
+    parser.add_argument("--seed-runs", type=int, default=3,
+                        help="runs of load_seed and the other slow operations (default 3)")
+    parser.add_argument("--auth-iterations", type=int, default=5,
+                        help="logins per case; each one hashes with PBKDF2 (default 5)")
+    parser.add_argument("--no-explore", action="store_true",
+                        help="skip the Explore pipeline (it imports Kivy/KivyMD)")
+    parser.add_argument("--output", help="write the JSON report here instead of stdout")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory(prefix="ponsiv-bench-") as tmp:
+        data = Path(args.data) if args.data else Path(tmp) / "data"
+        if not (data / "dataset.json").exists():
+            products, users, likes = synthetic.scale_from_args(args)
+            print(f"generating {products} products, {users} users, {likes} likes in {data}",
+                  file=sys.stderr)
+            synthetic.generate(data, products=products, users=users, likes=likes,
+                               seed=args.seed)
+        work = Path(tmp) / "work"
+        work.mkdir()
+        write_report(_run(args, data, work), args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,262 @@
+"""Synthetic catalogs and user/like populations for the store benchmarks.
+
+:func:`generate` writes, under one directory::
+
+    assets/informacion/<ID>.json   one per product, same format as the app's
+    assets/prendas/<ID>.jpg        placeholder image (hard links to one file)
+    assets/logos/<brand>.png       placeholder logo per brand
+    users.db                       migrated database with users and likes
+
+Everything comes from a seeded ``random.Random``, so the same arguments
+produce the same dataset. Product popularity is skewed (a few products get
+most likes) and like timestamps are spread over the last
+``LIKE_SPAN_DAYS`` days, part of them inside the trending horizon.
+
+Every user's password is :data:`PASSWORD`; the PBKDF2 hash is computed once
+and shared, since hashing millions of times would take hours.
+
+Run on its own to keep a dataset around::
+
+    python -m benchmarks.synthetic /tmp/ponsiv-large --scale large
+"""
+import argparse
+import json
+import os
+import random
+import shutil
+import time
+from pathlib import Path
+from typing import Dict, Iterator, List, Tuple
+
+from ponsiv.auth import hash_password
+from ponsiv.catalog import ASSETS_PATH
+from ponsiv.db import Database
+from ponsiv.migrations import migrate
+
+# Tamaños predefinidos: (productos, usuarios, likes)
+SCALES: Dict[str, Tuple[int, int, int]] = {
+    "small": (1_000, 1_000, 50_000),
+    "medium": (10_000, 10_000, 1_000_000),
+    "large": (100_000, 100_000, 10_000_000),
+}
+
+PASSWORD = "bench-password"
+EMAIL_DOMAIN = "bench.ponsiv"
+
+# Mismas categorías que el catálogo real, para que los filtros de Explorar encuentren algo
+CATEGORIES = (
+    "Bermudas", "Camisas", "Camisetas", "Chaquetas", "Faldas", "Jerseys",
+    "Pantalones", "Tops", "Vestidos", "Zapatillas",
+)
+BRANDS = ("Zara", "Ponsiv", "Nicoli", "Mango", "Bershka", "Stradivarius", "Pull&Bear", "Massimo")
+ADJECTIVES = (
+    "básica", "satinada", "oversize", "slim", "lino", "algodón", "estampada",
+    "denim", "punto", "crop", "recta", "fluida", "acolchada", "rayas",
+)
+SIZES = (["XS", "S", "M", "L", "XL"], ["S", "M", "L"], ["36", "38", "40", "42", "44"])
+
+# Cuanto mayor, más concentrados los likes en los primeros productos
+POPULARITY_SKEW = 3.0
+LIKE_SPAN_DAYS = 60
+# Filas por lote al insertar los likes
+BATCH_ROWS = 50_000
+
+
+def product_id(i: int) -> str:
+    return f"SYN_{i:06d}"
+
+
+def user_email(i: int) -> str:
+    return f"user{i}@{EMAIL_DOMAIN}"
+
+
+# ---------------------------------------------------------------- Catálogo --
+def _placeholder(path: Path, size: Tuple[int, int], fmt: str) -> None:
+    try:
+        from PIL import Image
+    except ImportError:
+        # Sin Pillow se reutiliza una imagen real del catálogo
+        real = next((ASSETS_PATH / "prendas").glob("*.jpg"), None)
+        if real is None:
+            raise RuntimeError("Pillow or an image in assets/prendas is needed")
+        shutil.copyfile(real, path)
+        return
+    Image.new("RGB", size, (205, 205, 210)).save(path, fmt)
+
+
+def _link(source: Path, target: Path) -> None:
+    try:
+        os.link(source, target)
+    except OSError:
+        shutil.copyfile(source, target)
+
+
+def write_catalog(assets: Path, products: int, rng: random.Random) -> List[str]:
+    """Write ``products`` JSON files with their images; return the categories used."""
+    info_dir, image_dir, logo_dir = (assets / name for name in ("informacion", "prendas", "logos"))
+    for folder in (info_dir, image_dir, logo_dir):
+        folder.mkdir(parents=True, exist_ok=True)
+
+    image = assets / "placeholder.jpg"
+    _placeholder(image, (64, 80), "JPEG")
+    logo = assets / "placeholder.png"
+    _placeholder(logo, (32, 32), "PNG")
+    for brand in BRANDS:
+        _link(logo, logo_dir / f"{brand}.png")
+
+    for i in range(products):
+        pid = product_id(i)
+        category = rng.choice(CATEGORIES)
+        data = {
+            "nombre": f"{category} {rng.choice(ADJECTIVES)} {rng.choice(ADJECTIVES)} {i}",
+            "marca": rng.choice(BRANDS),
+            "precio": round(rng.uniform(5, 150), 2),
+            "tallas": rng.choice(SIZES),
+            "categoria": category,
+        }
+        with open(info_dir / f"{pid}.json", "w", encoding="utf-8") as fh:
+            json.dump(data, fh, ensure_ascii=False)
+        _link(image, image_dir / f"{pid}.jpg")
+    return list(CATEGORIES)
+
+
+# ------------------------------------------------------- Usuarios y likes --
+def _user_rows(users: int) -> Iterator[tuple]:
+    password_hash = hash_password(PASSWORD)
+    for i in range(users):
+        yield (user_email(i), password_hash, f"User {i}", f"user{i}")
+
+
+def _like_rows(users: int, products: int, likes: int,
+               rng: random.Random) -> Iterator[tuple]:
+    now = time.time()
+    span = LIKE_SPAN_DAYS * 86400.0
+    per_user, extra = divmod(likes, users)
+    for uid in range(1, users + 1):
+        # Nunca más de la mitad del catálogo por usuario (si no, el muestreo no acaba)
+        wanted = min(per_user + (uid <= extra), products // 2)
+        liked = set()
+        while len(liked) < wanted:
+            liked.add(int(products * rng.random() ** POPULARITY_SKEW))
+        for idx in liked:
+            yield (uid, product_id(idx), now - span * rng.random())
+
+
+def _batches(rows: Iterator[tuple], size: int = BATCH_ROWS) -> Iterator[List[tuple]]:
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def write_database(path: Path, users: int, products: int, likes: int,
+                   rng: random.Random) -> int:
+    """Create a migrated database with ``users`` and about ``likes`` likes.
+
+    Returns the number of likes actually written. The ``likes`` indexes and
+    triggers are dropped during the bulk insert and recreated afterwards,
+    with ``like_counts`` rebuilt in one query.
+    """
+    db = Database(path)
+    try:
+        migrate(db)
+        with db.writer() as conn:
+            conn.execute("BEGIN")
+            # Índices y triggers de likes (los automáticos de UNIQUE no tienen sql)
+            ddl = conn.execute(
+                "SELECT type, name, sql FROM sqlite_master"
+                " WHERE tbl_name='likes' AND type IN ('index', 'trigger') AND sql IS NOT NULL"
+            ).fetchall()
+            for row in ddl:
+                conn.execute(f"DROP {row['type'].upper()} {row['name']}")
+
+            conn.executemany(
+                "INSERT INTO users (email, password_hash, name, handle) VALUES (?, ?, ?, ?)",
+                _user_rows(users),
+            )
+            for batch in _batches(_like_rows(users, products, likes, rng)):
+                conn.executemany(
+                    "INSERT OR IGNORE INTO likes (user_id, product_id, created_at) VALUES (?, ?, ?)",
+                    batch,
+                )
+
+            conn.execute("DELETE FROM like_counts")
+            conn.execute(
+                "INSERT INTO like_counts (product_id, count)"
+                " SELECT product_id, COUNT(*) FROM likes GROUP BY product_id"
+            )
+            for row in ddl:
+                conn.execute(row["sql"])
+        db.execute("ANALYZE")
+        return db.query_one("SELECT COUNT(*) FROM likes")[0]
+    finally:
+        db.close()
+
+
+def generate(out_dir: Path, *, products: int, users: int, likes: int,
+             seed: int = 0) -> Dict[str, object]:
+    """Write a synthetic dataset into ``out_dir`` (which must not exist yet).
+
+    Returns a description with the sizes and the seconds each part took.
+    """
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True)
+    rng = random.Random(seed)
+
+    start = time.perf_counter()
+    categories = write_catalog(out_dir / "assets", products, rng)
+    catalog_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    written = write_database(out_dir / "users.db", users, products, likes, rng)
+    database_s = time.perf_counter() - start
+
+    info = {
+        "products": products, "users": users, "likes": written, "seed": seed,
+        "categories": categories,
+        "generate_seconds": {"catalog": catalog_s, "database": database_s},
+    }
+    (out_dir / "dataset.json").write_text(json.dumps(info, indent=2) + "\n", encoding="utf-8")
+    return info
+
+
+def load_info(out_dir: Path) -> Dict[str, object]:
+    """Description written by :func:`generate` for an existing dataset."""
+    return json.loads((Path(out_dir) / "dataset.json").read_text(encoding="utf-8"))
+
+
+def add_scale_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--scale", choices=sorted(SCALES), default="small",
+                        help="preset sizes (default small); the flags below override it")
+    parser.add_argument("--products", type=int, help="number of products")
+    parser.add_argument("--users", type=int, help="number of users")
+    parser.add_argument("--likes", type=int, help="number of likes")
+    parser.add_argument("--seed", type=int, default=0, help="random seed (default 0)")
+
+
+def scale_from_args(args: argparse.Namespace) -> Tuple[int, int, int]:
+    products, users, likes = SCALES[args.scale]
+    return (
+        args.products if args.products is not None else products,
+        args.users if args.users is not None else users,
+        args.likes if args.likes is not None else likes,
+    )
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("out_dir", help="directory to create")
+    add_scale_arguments(parser)
+    args = parser.parse_args(argv)
+    products, users, likes = scale_from_args(args)
+    info = generate(Path(args.out_dir), products=products, users=users, likes=likes,
+                    seed=args.seed)
+    print(json.dumps(info, indent=2))
+
+
+if __name__ == "__main__":
+    main()
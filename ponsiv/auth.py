@@ -0,0 +1,46 @@
+import hashlib
+import hmac
+import os
+
+# Formato: pbkdf2_sha256$<iteraciones>$<sal hex>$<hash hex>
+ALGORITHM = "pbkdf2_sha256"
+ITERATIONS = 600_000
+SALT_BYTES = 16
+
+
+def hash_password(password: str, *, iterations: int = ITERATIONS) -> str:
+    """Salted PBKDF2-HMAC-SHA256 hash of ``password``, ready to store.
+
+    This is deliberately slow (hundreds of milliseconds): call it from a
+    worker thread, never from the Kivy thread.
+    """
+    salt = os.urandom(SALT_BYTES)
+    digest = hashlib.pbkdf2_hmac("sha256", password.encode(), salt, iterations)
+    return f"{ALGORITHM}${iterations}${salt.hex()}${digest.hex()}"
+
+
+def verify_password(password: str, stored: str) -> bool:
+    """Check ``password`` against a stored hash (PBKDF2 or legacy SHA-256)."""
+    if stored.startswith(ALGORITHM + "$"):
+        try:
+            _, iterations, salt, expected = stored.split("$")
+            digest = hashlib.pbkdf2_hmac(
+                "sha256", password.encode(), bytes.fromhex(salt), int(iterations)
+            )
+        except ValueError:
+            return False
+        return hmac.compare_digest(digest.hex(), expected)
+    # Filas antiguas: SHA-256 sin sal en hexadecimal
+    legacy = hashlib.sha256(password.encode()).hexdigest()
+    return hmac.compare_digest(legacy, stored)
+
+
+def needs_rehash(stored: str, *, iterations: int = ITERATIONS) -> bool:
+    """True for legacy hashes and PBKDF2 hashes weaker than ``iterations``."""
+    parts = stored.split("$")
+    if len(parts) != 4 or parts[0] != ALGORITHM:
+        return True
+    try:
+        return int(parts[1]) < iterations
+    except ValueError:
+        return True
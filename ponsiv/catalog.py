@@ -0,0 +1,201 @@
+import os
+import json
+import time
+import pickle
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import astuple
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from .models import Product
+
+ASSETS_PATH = Path(__file__).resolve().parent.parent / "assets"
+SNAPSHOT_PATH = Path(__file__).resolve().parent / "catalog.snapshot"
+
+# Sube este número si cambia el formato de los registros guardados
+SNAPSHOT_VERSION = 1
+
+IMAGE_EXTS = (".jpg", ".png")
+LOGO_EXTS = (".png", ".jpg", ".jpeg")
+
+
+def list_assets(folder: Path) -> Dict[str, str]:
+    """Map every file name in ``folder`` to its path with a single listing."""
+    try:
+        with os.scandir(folder) as it:
+            return {e.name: e.path for e in it}
+    except OSError:
+        return {}
+
+
+def _find_asset(folder: Path, stem: str, exts: Tuple[str, ...],
+                listing: Optional[Dict[str, str]] = None) -> Optional[str]:
+    for ext in exts:
+        name = f"{stem}{ext}"
+        if listing is not None:
+            if name in listing:
+                return listing[name]
+        elif (folder / name).exists():
+            return str(folder / name)
+    return None
+
+
+def resolve_assets(product: Product, base_path: Path = ASSETS_PATH,
+                   listings: Optional[Tuple[Dict[str, str], Dict[str, str]]] = None) -> Product:
+    """Fill ``images`` and ``logo`` from ``prendas`` and ``logos``.
+
+    ``listings`` are the ``(prendas, logos)`` maps from :func:`list_assets`;
+    without them every candidate extension is probed with ``exists()``.
+    """
+    images, logos = listings or (None, None)
+    image_file = _find_asset(base_path / "prendas", product.id, IMAGE_EXTS, images)
+    product.images = [image_file] if image_file else []
+    product.logo = _find_asset(base_path / "logos", product.brand, LOGO_EXTS, logos)
+    return product
+
+
+def parse_product(info_file: Path) -> Product:
+    """Parse one ``informacion/*.json`` file (without resolving assets)."""
+    with open(info_file, "r", encoding="utf-8") as fh:
+        data = json.load(fh)
+
+    pid = info_file.stem
+    return Product(
+        id=pid,
+        brand=data.get("marca", ""),
+        title=data.get("nombre", pid),
+        price=data.get("precio", 0.0),
+        sizes=data.get("tallas", []),
+        images=[],
+        category=data.get("categoria") or None,
+    )
+
+
+# --------------------------------------------------------------- Snapshot --
+def _assets_signature(base_path: Path) -> Tuple[int, int]:
+    """mtime of the image/logo folders: changes when files are added or removed."""
+    sig = []
+    for name in ("prendas", "logos"):
+        try:
+            sig.append((base_path / name).stat().st_mtime_ns)
+        except OSError:
+            sig.append(0)
+    return tuple(sig)
+
+
+def _read_snapshot(snapshot_path: Path, base_path: Path) -> Optional[dict]:
+    try:
+        with open(snapshot_path, "rb") as fh:
+            snap = pickle.load(fh)
+    except Exception:
+        # No existe o está corrupto: se regenera
+        return None
+    if not isinstance(snap, dict) or snap.get("version") != SNAPSHOT_VERSION:
+        return None
+    if snap.get("base") != str(base_path):
+        return None
+    return snap
+
+
+def _write_snapshot(snapshot_path: Path, snap: dict) -> None:
+    tmp = snapshot_path.with_name(snapshot_path.name + ".tmp")
+    try:
+        with open(tmp, "wb") as fh:
+            pickle.dump(snap, fh, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, snapshot_path)
+    except OSError:
+        # Instalación de solo lectura: seguimos sin caché
+        pass
+
+
+def load_products(
+    base_path: Path = ASSETS_PATH,
+    snapshot_path: Optional[Path] = SNAPSHOT_PATH,
+    *,
+    workers: int = 0,
+    processes: bool = False,
+    timings: Optional[Dict[str, float]] = None,
+) -> List[Product]:
+    """Load every product described in ``base_path / "informacion"``.
+
+    With a ``snapshot_path`` the already-resolved records are read from one
+    pickle and only the JSON files whose ``(mtime, size)`` differ from the
+    snapshot manifest are parsed again. If files were added to or removed
+    from ``prendas``/``logos`` the cached records are kept but their image
+    and logo paths are resolved again.
+
+    ``workers > 0`` enables the parallel mode: ``prendas`` and ``logos`` are
+    listed once and the JSON files are parsed on a thread pool (or a process
+    pool with ``processes=True``). If a ``timings`` dict is given it is filled
+    with the seconds spent in each phase.
+    """
+    phases: Dict[str, float] = {}
+    clock = time.perf_counter()
+
+    def _lap(name: str) -> None:
+        nonlocal clock
+        now = time.perf_counter()
+        phases[name] = now - clock
+        clock = now
+
+    snap = _read_snapshot(snapshot_path, base_path) if snapshot_path else None
+    cached: Dict[str, tuple] = snap["entries"] if snap else {}
+    assets_sig = _assets_signature(base_path)
+    assets_changed = snap is None or snap.get("assets") != assets_sig
+    _lap("snapshot")
+
+    with os.scandir(base_path / "informacion") as it:
+        infos = sorted((e for e in it if e.name.endswith(".json")), key=lambda e: e.name)
+    manifests = []
+    misses = []
+    for entry in infos:
+        st = entry.stat()
+        manifest = (st.st_mtime_ns, st.st_size)
+        manifests.append(manifest)
+        hit = cached.get(entry.name)
+        if hit is None or hit[0] != manifest:
+            misses.append(Path(entry.path))
+    _lap("scan")
+
+    listings = None
+    if workers > 0:
+        listings = (list_assets(base_path / "prendas"), list_assets(base_path / "logos"))
+    _lap("list")
+
+    if workers > 0 and len(misses) > 1:
+        pool_cls = ProcessPoolExecutor if processes else ThreadPoolExecutor
+        chunksize = max(1, len(misses) // (workers * 4))
+        with pool_cls(max_workers=workers) as pool:
+            parsed = list(pool.map(parse_product, misses, chunksize=chunksize))
+    else:
+        parsed = [parse_product(path) for path in misses]
+    fresh = {path.name: product for path, product in zip(misses, parsed)}
+    _lap("parse")
+
+    entries: Dict[str, tuple] = {}
+    products: List[Product] = []
+    for entry, manifest in zip(infos, manifests):
+        product = fresh.get(entry.name)
+        if product is None:
+            product = Product(*cached[entry.name][1])
+            if assets_changed:
+                resolve_assets(product, base_path, listings)
+        else:
+            resolve_assets(product, base_path, listings)
+        entries[entry.name] = (manifest, astuple(product))
+        products.append(product)
+    _lap("resolve")
+
+    if snapshot_path and (fresh or assets_changed or len(entries) != len(cached)):
+        _write_snapshot(snapshot_path, {
+            "version": SNAPSHOT_VERSION,
+            "base": str(base_path),
+            "assets": assets_sig,
+            "entries": entries,
+        })
+    _lap("write")
+
+    if timings is not None:
+        timings.update(phases)
+        timings["total"] = sum(phases.values())
+    return products
@@ -0,0 +1,43 @@
+from kivymd.uix.fitimage import FitImage
+
+from ponsiv.texture_cache import texture_cache
+
+
+class CachedImage(FitImage):
+    """
+    FitImage que obtiene su textura de la caché compartida (texture_cache):
+      - show(path, width): muestra `path` pintada a `width` px de ancho;
+        suelta la textura anterior y reserva la nueva mientras se vea
+      - release(): suelta la textura; llamarlo antes de descartar el widget,
+        porque una textura reservada nunca se expulsa de la caché
+      - mientras se decodifica queda transparente (se ve el fondo del padre)
+    """
+
+    def __init__(self, **kwargs):
+        kwargs.setdefault("opacity", 0)
+        super().__init__(**kwargs)
+        self._path = None
+        self._width = None
+        self._key = None
+
+    def show(self, path: str, width=None) -> None:
+        if path == self._path and width == self._width:
+            return
+        cache = texture_cache()
+        old = self._key
+        self._path, self._width = path, width
+        self.opacity = 0
+        self._key = cache.acquire(path, width, lambda tex, p=path, w=width: self._on_texture(p, w, tex))
+        cache.release(old)
+
+    def release(self) -> None:
+        """Suelta la textura reservada (no se ve nada hasta el siguiente show())."""
+        texture_cache().release(self._key)
+        self._path = self._width = self._key = None
+        self.opacity = 0
+
+    def _on_texture(self, path, width, texture) -> None:
+        # Si entretanto se pidió otra imagen, esta textura ya no toca
+        if path == self._path and width == self._width:
+            self.source = texture
+            self.opacity = 1
@@ -1,21 +1,25 @@
+import os
 from pathlib import Path
-from kivy.properties import StringProperty, BooleanProperty
+from kivy.properties import BooleanProperty, ObjectProperty
 from kivy.uix.behaviors import ButtonBehavior
 from kivymd.uix.fitimage import FitImage
 
+ICONS_PATH = Path(__file__).resolve().parents[2] / "assets" / "icons"
+ATLAS_NAME = "icons"
+
 
 class ImageToggleButton(ButtonBehavior, FitImage):
     """
     Botón basado en imagen con dos estados: normal / selected.
-    - normal_source: ruta PNG para estado normal
-    - selected_source: ruta PNG para estado seleccionado (opcional; si no, usa normal)
+    - normal_source: ruta PNG (o textura del atlas) para estado normal
+    - selected_source: ídem para estado seleccionado (opcional; si no, usa normal)
     - selected: bool que cambia la imagen mostrada
     """
-    normal_source = StringProperty("")
-    selected_source = StringProperty("")
+    normal_source = ObjectProperty("")
+    selected_source = ObjectProperty("")
     selected = BooleanProperty(False)
 
-    def __init__(self, normal_source: str, selected_source: str | None = None,
+    def __init__(self, normal_source, selected_source=None,
                  selected: bool = False, **kwargs):
         super().__init__(**kwargs)
         self.normal_source = normal_source
@@ -30,19 +34,109 @@ class ImageToggleButton(ButtonBehavior, FitImage):
         self.source = self.selected_source if self.selected else self.normal_source
 
 
+class IconRegistry:
+    """
+    Registro de iconos de `assets/icons`, escaneado una sola vez:
+      - path(group, name, state): ruta del PNG o None, sin tocar el disco
+      - source(...): igual, pero si hay atlas prehorneado (ver `build_icon_atlas`)
+        devuelve la región de su textura compartida, válida como `source` de FitImage
+    El atlas se ignora si algún PNG es más reciente que él.
+    """
+
+    def __init__(self, root: Path = ICONS_PATH):
+        self.root = Path(root)
+        self._paths: dict[tuple, str] | None = None
+        self._atlas_ok = False
+        self._atlas = None
+
+    def _scan(self) -> dict[tuple, str]:
+        if self._paths is None:
+            paths: dict[tuple, str] = {}
+            newest = 0.0
+            for dirpath, _dirs, files in os.walk(self.root):
+                rel = Path(dirpath).relative_to(self.root).parts
+                for fname in files:
+                    if not fname.endswith(".png") or fname.startswith(ATLAS_NAME):
+                        continue
+                    full = os.path.join(dirpath, fname)
+                    paths[rel + (fname[:-4],)] = full
+                    newest = max(newest, os.path.getmtime(full))
+            atlas = self.root / f"{ATLAS_NAME}.atlas"
+            self._atlas_ok = atlas.exists() and atlas.stat().st_mtime >= newest
+            self._paths = paths
+        return self._paths
+
+    def path(self, *parts: str) -> str | None:
+        return self._scan().get(parts)
+
+    def source(self, *parts: str):
+        path = self.path(*parts)
+        if path is None or not self._atlas_ok:
+            return path
+        if self._atlas is None:
+            # La textura se crea en el primer uso (hace falta la ventana)
+            from kivy.atlas import Atlas
+            self._atlas = Atlas(str(self.root / f"{ATLAS_NAME}.atlas"))
+        return self._atlas.textures.get(_atlas_id(parts), path)
+
+
+def _atlas_id(parts) -> str:
+    return "-".join(parts)
+
+
+def build_icon_atlas(icon_px: int = 96, atlas_size: int = 1024) -> Path:
+    """
+    Empaqueta todos los PNG de `assets/icons` (reducidos a `icon_px`) en
+    `assets/icons/icons.atlas` + `icons-0.png`. Paso opcional de build:
+        python -m ponsiv.components.image_icon
+    Necesita Pillow.
+    """
+    import tempfile
+    from PIL import Image
+    from kivy.atlas import Atlas
+
+    registry = IconRegistry()
+    with tempfile.TemporaryDirectory() as tmp:
+        files = []
+        for parts, path in sorted(registry._scan().items()):
+            with Image.open(path) as img:
+                img = img.convert("RGBA")
+                img.thumbnail((icon_px, icon_px), Image.LANCZOS)
+                out = os.path.join(tmp, f"{_atlas_id(parts)}.png")
+                img.save(out)
+            files.append(out)
+        Atlas.create(str(ICONS_PATH / ATLAS_NAME), files, atlas_size)
+    return ICONS_PATH / f"{ATLAS_NAME}.atlas"
+
+
+icons = IconRegistry()
+
+
 def icon_path(group: str, name: str, state: str = "normal") -> str | None:
     """
     Devuelve 'assets/icons/<group>/<name>/<state>.png' si existe; si no, None.
     group: 'nav' | 'actions' | 'topbar'
     state: 'normal' | 'selected'
     """
-    p = Path(__file__).resolve().parents[2] / "assets" / "icons" / group / name / f"{state}.png"
-    return str(p) if p.exists() else None
+    return icons.path(group, name, state)
 
 
 def single_icon_path(group: str, name: str) -> str | None:
     """
     Para iconos de un solo estado, p.ej. search/magnify.png
     """
-    p = Path(__file__).resolve().parents[2] / "assets" / "icons" / group / f"{name}.png"
-    return str(p) if p.exists() else None
+    return icons.path(group, name)
+
+
+def icon_source(group: str, name: str, state: str = "normal"):
+    """Como `icon_path`, pero sale del atlas si está construido (textura o ruta)."""
+    return icons.source(group, name, state)
+
+
+def single_icon_source(group: str, name: str):
+    """Como `single_icon_path`, pero sale del atlas si está construido."""
+    return icons.source(group, name)
+
+
+if __name__ == "__main__":
+    print(build_icon_atlas())
@@ -0,0 +1,68 @@
+from kivy.metrics import dp
+from kivy.uix.floatlayout import FloatLayout
+from kivymd.uix.boxlayout import MDBoxLayout
+from kivymd.uix.card import MDCard
+from kivymd.uix.label import MDLabel
+
+from ponsiv.components.cached_image import CachedImage
+
+
+class ProductCard(MDCard):
+    """
+    Tarjeta de producto reutilizable: imagen arriba + franja con marca y precio.
+    Se construye una vez y se vuelve a enlazar a otro producto con `bind_product`,
+    así las listas pueden reciclar tarjetas en vez de crearlas de nuevo.
+      - on_open(product_id): callback al tocar la tarjeta
+      - image_width: ancho (px) al que se pinta la imagen, para elegir la
+        miniatura más pequeña que sirva; por defecto el ancho de la tarjeta
+    """
+
+    def __init__(self, on_open=None, info_height=dp(54), info_padding=(dp(8), dp(6)),
+                 brand_color=(0, 0, 0, 0.9), image_width=None, **kwargs):
+        kwargs.setdefault("size_hint", (None, None))
+        kwargs.setdefault("size", (dp(120), dp(180)))
+        kwargs.setdefault("radius", [dp(12)])
+        kwargs.setdefault("elevation", 0)
+        kwargs.setdefault("md_bg_color", (1, 1, 1, 1))
+        super().__init__(**kwargs)
+        self.on_open = on_open
+        self.image_width = image_width
+        self.product = None
+        self.product_id = None
+
+        v = MDBoxLayout(orientation="vertical")
+        # Imagen o "Sin imagen" en el mismo hueco; se alterna con opacity
+        media = FloatLayout(size_hint=(1, 1))
+        self.image = CachedImage(size_hint=(1, 1), pos_hint={"x": 0, "y": 0})
+        self.no_image = MDLabel(text="Sin imagen", halign="center",
+                                size_hint=(1, 1), pos_hint={"x": 0, "y": 0})
+        media.add_widget(self.image)
+        media.add_widget(self.no_image)
+        v.add_widget(media)
+
+        info = MDBoxLayout(orientation="vertical", size_hint=(1, None), height=info_height,
+                           padding=info_padding)
+        self.brand_label = MDLabel(text="", font_size="12sp",
+                                   theme_text_color="Custom", text_color=brand_color)
+        self.price_label = MDLabel(text="", font_size="13sp", bold=True,
+                                   theme_text_color="Custom", text_color=(0, 0, 0, 1))
+        info.add_widget(self.brand_label)
+        info.add_widget(self.price_label)
+        v.add_widget(info)
+        self.add_widget(v)
+
+    def bind_product(self, product) -> None:
+        self.product = product
+        self.product_id = product.id
+        src = product.images[0] if product.images else ""
+        # Textura compartida (texture_cache) de la miniatura que cubre el ancho
+        self.image.show(src, self.image_width or self.width)
+        self.no_image.opacity = 0 if src else 1
+        self.brand_label.text = product.brand or ""
+        self.price_label.text = f"{product.price:.2f} €"
+
+    def on_touch_up(self, touch):
+        if self.product_id and self.on_open and self.collide_point(*touch.pos):
+            self.on_open(self.product_id)
+            return True
+        return super().on_touch_up(touch)
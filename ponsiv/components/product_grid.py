@@ -0,0 +1,63 @@
+from kivy.metrics import dp
+from kivy.uix.recycleboxlayout import RecycleBoxLayout
+from kivy.uix.recyclegridlayout import RecycleGridLayout
+from kivy.uix.recycleview import RecycleView
+from kivy.uix.recycleview.views import RecycleDataViewBehavior
+
+from ponsiv.components.product_card import ProductCard
+
+
+class ProductGridCard(RecycleDataViewBehavior, ProductCard):
+    """ProductCard usada como vista de un ProductGrid: se reenlaza desde `data`."""
+
+    def refresh_view_attrs(self, rv, index, data):
+        self.on_open = rv.on_open
+        if self.product is not data["product"]:
+            self.bind_product(data["product"])
+
+
+class ProductGrid(RecycleView):
+    """
+    Rejilla (o fila) virtualizada de productos sobre RecycleView:
+    solo existen las tarjetas visibles más `overscan` píxeles por cada lado,
+    y al hacer scroll las mismas tarjetas se reenlazan a otros productos.
+      - orientation="vertical": rejilla de `cols` columnas con scroll vertical
+      - orientation="horizontal": una fila con scroll horizontal
+      - item_size: tamaño de cada tarjeta (None = ocupa el ancho de columna)
+      - viewclass: subclase de ProductGridCard con el estilo de tarjeta
+    """
+
+    def __init__(self, on_open=None, orientation="vertical", cols=2,
+                 item_size=(None, dp(280)), spacing=dp(10), padding=(dp(8), dp(8)),
+                 overscan=dp(200), viewclass=ProductGridCard, **kwargs):
+        super().__init__(**kwargs)
+        self.on_open = on_open
+        self.overscan = overscan
+        size_hint = tuple(None if v is not None else 1 for v in item_size)
+        if orientation == "horizontal":
+            self.do_scroll_x, self.do_scroll_y = True, False
+            layout = RecycleBoxLayout(orientation="horizontal", size_hint=(None, 1),
+                                      spacing=spacing, padding=padding)
+            layout.bind(minimum_width=layout.setter("width"))
+        else:
+            self.do_scroll_x, self.do_scroll_y = False, True
+            layout = RecycleGridLayout(cols=cols, size_hint=(1, None),
+                                       spacing=spacing, padding=padding)
+            layout.bind(minimum_height=layout.setter("height"))
+        layout.default_size = tuple(v if v is not None else 0 for v in item_size)
+        layout.default_size_hint = size_hint
+        self.add_widget(layout)
+        self.viewclass = viewclass
+
+    def set_products(self, products) -> None:
+        self.data = [{"product": p} for p in products]
+
+    def get_viewport(self):
+        # Amplía la zona visible para tener preparadas las tarjetas contiguas
+        left, bottom, width, height = super().get_viewport()
+        pad = self.overscan
+        if self.do_scroll_x:
+            left, width = max(0, left - pad), width + 2 * pad
+        if self.do_scroll_y:
+            bottom, height = max(0, bottom - pad), height + 2 * pad
+        return left, bottom, width, height
@@ -1,16 +1,25 @@
+from kivy.core.window import Window
 from kivy.metrics import dp
 from kivy.properties import ObjectProperty
 from kivy.uix.floatlayout import FloatLayout
 from kivymd.uix.card import MDCard
-from kivymd.uix.fitimage import FitImage
 from kivymd.uix.button import MDIconButton
 from kivymd.uix.label import MDLabel
-from ponsiv.components.image_icon import ImageToggleButton, icon_path
+from ponsiv.components.image_icon import ImageToggleButton, icon_source
+from ponsiv.components.cached_image import CachedImage
 
 from ..store import store
 
+# Fondo que se ve mientras se decodifica la imagen
+PLACEHOLDER_BG = (0.93, 0.94, 0.96, 1)
 
-def _round_image_chip(src_normal: str, src_selected: str | None = None,
+
+def slide_image(product):
+    """Imagen de un slide y ancho (px) al que se pinta: el de la ventana."""
+    return (product.images[0] if product.images else ""), Window.width
+
+
+def _round_image_chip(src_normal, src_selected=None,
                       pos_hint=None, selected=False, on_release=None) -> MDCard:
     """
     Crea el 'chip' blanco circular con tu imagen dentro.
@@ -42,19 +51,19 @@ class ProductSlide(FloatLayout):
 
     def __init__(self, product, **kwargs):
         super().__init__(**kwargs)
-        self.product = product
 
         # ── Imagen a pantalla completa ────────────────────────────────────────────
+        # La imagen se decodifica en segundo plano (texture_cache); hasta que
+        # llega la textura se ve el fondo de la tarjeta como placeholder
         self.img_card = MDCard(
             size_hint=(1, 1),
             pos_hint={"x": 0, "y": 0},
             radius=[0],
             elevation=0,
+            md_bg_color=PLACEHOLDER_BG,
         )
-        if product.images:
-            self.img_card.add_widget(
-                FitImage(source=product.images[0], size_hint=(1, 1))
-            )
+        self.image = CachedImage(size_hint=(1, 1))
+        self.img_card.add_widget(self.image)
         self.add_widget(self.img_card)
 
         # ── Tarjeta blanca de info como en el mock ───────────────────────────────
@@ -70,43 +79,37 @@ class ProductSlide(FloatLayout):
         # Contenido textual
         box = FloatLayout()
         # Título (1ª línea)
-        box.add_widget(
-            MDLabel(
-                text=self.product.title,
-                font_size="15sp",
-                bold=True,
-                theme_text_color="Custom",
-                text_color=(0, 0, 0, 1),
-                size_hint=(1, None),
-                height=dp(24),
-                pos_hint={"x": 0.05, "y": 0.55},
-            )
+        self.title_label = MDLabel(
+            font_size="15sp",
+            bold=True,
+            theme_text_color="Custom",
+            text_color=(0, 0, 0, 1),
+            size_hint=(1, None),
+            height=dp(24),
+            pos_hint={"x": 0.05, "y": 0.55},
         )
+        box.add_widget(self.title_label)
         # Marca (2ª línea)
-        box.add_widget(
-            MDLabel(
-                text=self.product.brand,
-                font_size="13sp",
-                theme_text_color="Custom",
-                text_color=(0, 0, 0, 0.7),
-                size_hint=(1, None),
-                height=dp(20),
-                pos_hint={"x": 0.05, "y": 0.32},
-            )
+        self.brand_label = MDLabel(
+            font_size="13sp",
+            theme_text_color="Custom",
+            text_color=(0, 0, 0, 0.7),
+            size_hint=(1, None),
+            height=dp(20),
+            pos_hint={"x": 0.05, "y": 0.32},
         )
+        box.add_widget(self.brand_label)
         # Precio (3ª línea)
-        box.add_widget(
-            MDLabel(
-                text=f"{self.product.price:.2f} €",
-                font_size="13sp",
-                bold=True,
-                theme_text_color="Custom",
-                text_color=(0, 0, 0, 1),
-                size_hint=(1, None),
-                height=dp(20),
-                pos_hint={"x": 0.05, "y": 0.08},
-            )
+        self.price_label = MDLabel(
+            font_size="13sp",
+            bold=True,
+            theme_text_color="Custom",
+            text_color=(0, 0, 0, 1),
+            size_hint=(1, None),
+            height=dp(20),
+            pos_hint={"x": 0.05, "y": 0.08},
         )
+        box.add_widget(self.price_label)
         info.add_widget(box)
         self.add_widget(info)
 
@@ -115,14 +118,12 @@ class ProductSlide(FloatLayout):
         base_y = 0.60
         step = 0.10
 
-        heart_normal = icon_path("actions", "heart", "normal")
-        heart_selected = icon_path("actions", "heart", "selected")
+        heart_normal = icon_source("actions", "heart", "normal")
+        heart_selected = icon_source("actions", "heart", "selected")
         if heart_normal:
-            liked = store.current_user_id and store.is_product_liked(store.current_user_id, self.product.id)
             self.heart_chip = _round_image_chip(
                 heart_normal, heart_selected,
                 pos_hint={"center_x": 0.93, "center_y": base_y},
-                selected=bool(liked),
                 on_release=self.toggle_like,
             )
             self.add_widget(self.heart_chip)
@@ -131,8 +132,6 @@ class ProductSlide(FloatLayout):
                 "heart-outline", pos_hint={"center_x": 0.93, "center_y": base_y}
             )
             self.heart_btn.bind(on_release=self.toggle_like)
-            if store.current_user_id and store.is_product_liked(store.current_user_id, self.product.id):
-                self.heart_btn.icon = "heart"
             self.add_widget(self.heart_btn)
 
         pairs = [
@@ -141,7 +140,7 @@ class ProductSlide(FloatLayout):
             ("tshirt", base_y - 3 * step),
         ]
         for name, cy in pairs:
-            normal = icon_path("actions", name, "normal")
+            normal = icon_source("actions", name, "normal")
             if normal:
                 chip = _round_image_chip(normal, pos_hint={"center_x": 0.93, "center_y": cy})
                 self.add_widget(chip)
@@ -157,6 +156,31 @@ class ProductSlide(FloatLayout):
                     )
                 )
 
+        self.bind_product(product)
+
+    def bind_product(self, product) -> None:
+        """Muestra otro producto reutilizando los widgets ya creados."""
+        self.product = product
+        self.image.show(*slide_image(product))
+        self.title_label.text = product.title
+        self.brand_label.text = product.brand
+        self.price_label.text = f"{product.price:.2f} €"
+        self.refresh_like()
+
+    def release(self) -> None:
+        """Suelta la textura de la imagen; llamar antes de descartar la slide."""
+        self.image.release()
+
+    def refresh_like(self) -> None:
+        liked = bool(store.current_user_id and store.is_product_liked(store.current_user_id, self.product.id))
+        self._show_liked(liked)
+
+    def _show_liked(self, liked: bool) -> None:
+        if hasattr(self, "heart_chip"):
+            self.heart_chip._img_btn.selected = liked
+        if hasattr(self, "heart_btn"):
+            self.heart_btn.icon = "heart" if liked else "heart-outline"
+
     def _round_icon(self, icon_name: str, pos_hint: dict) -> MDIconButton:
         """
         Botón circular blanco pequeño con icono gris oscuro, como en el mock.
@@ -179,7 +203,4 @@ class ProductSlide(FloatLayout):
         if not store.current_user_id:
             return
         liked = store.toggle_like(store.current_user_id, self.product.id)
-        if hasattr(self, "heart_chip"):
-            self.heart_chip._img_btn.selected = liked
-        if hasattr(self, "heart_btn"):
-            self.heart_btn.icon = "heart" if liked else "heart-outline"
+        self._show_liked(liked)
@@ -0,0 +1,101 @@
+import queue
+import sqlite3
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Iterable, Iterator, List, Optional, Sequence
+
+
+class Database:
+    """SQLite access that can be shared by the UI thread and worker threads.
+
+    * WAL journal, so readers never block the writer (or vice versa);
+      ``synchronous=NORMAL`` (safe in WAL mode) and a busy timeout.
+    * A single writer connection guarded by a lock: SQLite only allows one
+      writer at a time, so serialising here avoids ``database is locked``.
+    * A pool of up to ``readers`` read connections, created on demand.
+    * Every connection keeps a statement cache of ``statement_cache``
+      entries, so repeated queries reuse their prepared statement.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        readers: int = 4,
+        busy_timeout: float = 5.0,
+        statement_cache: int = 256,
+    ) -> None:
+        self.path = Path(path)
+        self.busy_timeout = busy_timeout
+        self.statement_cache = statement_cache
+        self._max_readers = max(1, readers)
+        self._readers: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue()
+        self._reader_count = 0
+        self._pool_lock = threading.Lock()
+        self._write_lock = threading.RLock()
+        self._all: List[sqlite3.Connection] = []
+        self._writer = self._connect()
+        self._writer.execute("PRAGMA journal_mode=WAL")
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            self.path,
+            timeout=self.busy_timeout,
+            check_same_thread=False,
+            cached_statements=self.statement_cache,
+        )
+        conn.row_factory = sqlite3.Row
+        conn.execute(f"PRAGMA busy_timeout={int(self.busy_timeout * 1000)}")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        self._all.append(conn)
+        return conn
+
+    # Connections -----------------------------------------------------------
+    @contextmanager
+    def reader(self) -> Iterator[sqlite3.Connection]:
+        """Borrow a read connection from the pool (blocks if all are in use)."""
+        try:
+            conn = self._readers.get_nowait()
+        except queue.Empty:
+            with self._pool_lock:
+                create = self._reader_count < self._max_readers
+                if create:
+                    self._reader_count += 1
+            conn = self._connect() if create else self._readers.get()
+        try:
+            yield conn
+        finally:
+            self._readers.put(conn)
+
+    @contextmanager
+    def writer(self) -> Iterator[sqlite3.Connection]:
+        """Run a transaction on the writer connection (commit or roll back)."""
+        with self._write_lock:
+            with self._writer:
+                yield self._writer
+
+    # Helpers ---------------------------------------------------------------
+    def query(self, sql: str, params: Sequence[Any] = ()) -> List[sqlite3.Row]:
+        with self.reader() as conn:
+            return conn.execute(sql, params).fetchall()
+
+    def query_one(self, sql: str, params: Sequence[Any] = ()) -> Optional[sqlite3.Row]:
+        with self.reader() as conn:
+            return conn.execute(sql, params).fetchone()
+
+    def execute(self, sql: str, params: Sequence[Any] = ()) -> sqlite3.Cursor:
+        """Run one write statement in its own transaction."""
+        with self.writer() as conn:
+            return conn.execute(sql, params)
+
+    def executemany(self, sql: str, rows: Iterable[Sequence[Any]]) -> None:
+        """Run ``sql`` for every row of ``rows`` in a single transaction."""
+        with self.writer() as conn:
+            conn.executemany(sql, rows)
+
+    def close(self) -> None:
+        with self._write_lock, self._pool_lock:
+            for conn in self._all:
+                conn.close()
+            self._all.clear()
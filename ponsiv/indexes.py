@@ -0,0 +1,87 @@
+from bisect import bisect_left, bisect_right, insort
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .models import Product
+
+
+def _key(value: Optional[str]) -> str:
+    return (value or "").lower()
+
+
+class CatalogIndex:
+    """Secondary indexes over the catalog: category, brand and price.
+
+    Category and brand keys are lowercased; each maps to the product ids in
+    insertion order (a dict used as an ordered set). Prices are kept as a
+    sorted list of ``(price, id)`` pairs for range queries with ``bisect``.
+    """
+
+    def __init__(self) -> None:
+        self._reset()
+
+    def _reset(self) -> None:
+        self._by_category: Dict[str, Dict[str, None]] = {}
+        self._by_brand: Dict[str, Dict[str, None]] = {}
+        self._category_names: Dict[str, int] = {}
+        self._prices: List[Tuple[float, str]] = []
+        self._categories: Optional[List[str]] = None
+
+    def rebuild(self, products: Iterable[Product]) -> None:
+        self._reset()
+        prices = []
+        for p in products:
+            self._link(p)
+            prices.append((float(p.price or 0.0), p.id))
+        prices.sort()
+        self._prices = prices
+
+    def add(self, product: Product) -> None:
+        self._link(product)
+        insort(self._prices, (float(product.price or 0.0), product.id))
+
+    def remove(self, product: Product) -> None:
+        for index, key in ((self._by_category, _key(product.category)),
+                           (self._by_brand, _key(product.brand))):
+            ids = index.get(key)
+            if ids is not None:
+                ids.pop(product.id, None)
+                if not ids:
+                    del index[key]
+        if product.category:
+            left = self._category_names.get(product.category, 0) - 1
+            if left > 0:
+                self._category_names[product.category] = left
+            else:
+                self._category_names.pop(product.category, None)
+                self._categories = None
+        entry = (float(product.price or 0.0), product.id)
+        i = bisect_left(self._prices, entry)
+        if i < len(self._prices) and self._prices[i] == entry:
+            del self._prices[i]
+
+    def _link(self, product: Product) -> None:
+        self._by_category.setdefault(_key(product.category), {})[product.id] = None
+        self._by_brand.setdefault(_key(product.brand), {})[product.id] = None
+        if product.category:
+            if product.category not in self._category_names:
+                self._categories = None
+            self._category_names[product.category] = self._category_names.get(product.category, 0) + 1
+
+    # Queries ---------------------------------------------------------------
+    def categories(self) -> List[str]:
+        if self._categories is None:
+            self._categories = sorted(self._category_names)
+        return self._categories
+
+    def category_ids(self, category: Optional[str]) -> List[str]:
+        return list(self._by_category.get(_key(category), ()))
+
+    def brand_ids(self, brand: Optional[str]) -> List[str]:
+        return list(self._by_brand.get(_key(brand), ()))
+
+    def price_range_ids(self, min_price: Optional[float] = None,
+                        max_price: Optional[float] = None) -> List[str]:
+        """Ids with ``min_price <= price <= max_price``, cheapest first."""
+        lo = 0 if min_price is None else bisect_left(self._prices, (min_price,))
+        hi = len(self._prices) if max_price is None else bisect_right(self._prices, (max_price, "\U0010ffff"))
+        return [pid for _, pid in self._prices[lo:hi]]
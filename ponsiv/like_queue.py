@@ -0,0 +1,122 @@
+import atexit
+import logging
+import threading
+from typing import Dict, Optional, Tuple
+
+from .db import Database
+
+logger = logging.getLogger(__name__)
+
+# (user_id, product_id) -> created_at del like, o None si se ha quitado
+_Key = Tuple[int, str]
+
+
+class LikeQueue:
+    """Write-behind queue for like toggles.
+
+    ``put`` only records the latest state of each (user, product) pair; a
+    background thread writes the pending pairs with ``executemany`` in a
+    single transaction every ``interval`` seconds, or as soon as
+    ``max_pending`` pairs are waiting. A like followed by an unlike before
+    the flush never reaches the database. Call :meth:`close` (or
+    :meth:`flush`) before exiting; an ``atexit`` hook flushes as a fallback.
+    """
+
+    def __init__(self, db: Database, *, interval: float = 0.3, max_pending: int = 64) -> None:
+        self.db = db
+        self.interval = interval
+        self.max_pending = max_pending
+        self._pending: Dict[_Key, Optional[float]] = {}
+        self._cond = threading.Condition()
+        # Serializa los volcados para que se apliquen en orden
+        self._flush_lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+    def put(self, user_id: int, product_id: str, created_at: Optional[float]) -> None:
+        """Queue a like made at ``created_at``, or its removal if ``None``."""
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("LikeQueue is closed")
+            was_empty = not self._pending
+            # El último estado gana: like + unlike seguidos se quedan en un DELETE
+            self._pending.pop((user_id, product_id), None)
+            self._pending[(user_id, product_id)] = created_at
+            if self._thread is None:
+                self._start()
+            # El primer cambio arranca el intervalo; al llegar a max_pending se vuelca ya
+            if was_empty or len(self._pending) >= self.max_pending:
+                self._cond.notify()
+
+    def _start(self) -> None:
+        self._thread = threading.Thread(target=self._run, name="ponsiv-like-writer", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                if not self._pending and not self._closed:
+                    self._cond.wait()
+                if self._closed:
+                    return
+                if len(self._pending) < self.max_pending:
+                    # Agrupa los toques que lleguen durante el intervalo
+                    self._cond.wait(self.interval)
+                if self._closed:
+                    return
+            try:
+                self.flush()
+            except Exception:
+                # Los cambios vuelven a la cola y se reintentan en la siguiente vuelta
+                logger.exception("Could not write pending likes")
+                with self._cond:
+                    self._cond.wait(self.interval)
+
+    def flush(self) -> int:
+        """Write every pending change now; return how many pairs were written."""
+        with self._flush_lock:
+            with self._cond:
+                batch, self._pending = self._pending, {}
+            if not batch:
+                return 0
+            added = [(uid, pid, ts) for (uid, pid), ts in batch.items() if ts is not None]
+            removed = [(uid, pid) for (uid, pid), ts in batch.items() if ts is None]
+            try:
+                with self.db.writer() as conn:
+                    if removed:
+                        conn.executemany(
+                            "DELETE FROM likes WHERE user_id=? AND product_id=?", removed
+                        )
+                    if added:
+                        # unlike + like antes del volcado: la fila sigue ahí y
+                        # se queda con la fecha nueva, como en memoria
+                        conn.executemany(
+                            "INSERT INTO likes (user_id, product_id, created_at) "
+                            "VALUES (?, ?, ?) "
+                            "ON CONFLICT(user_id, product_id) "
+                            "DO UPDATE SET created_at=excluded.created_at",
+                            added,
+                        )
+            except Exception:
+                with self._cond:
+                    # Lo encolado mientras tanto es más reciente y tiene prioridad
+                    batch.update(self._pending)
+                    self._pending = batch
+                raise
+            return len(batch)
+
+    def close(self) -> None:
+        """Stop the writer thread and flush whatever is still pending."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+        self.flush()
+        atexit.unregister(self.close)
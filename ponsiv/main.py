@@ -1,24 +1,16 @@
 from kivy.core.window import Window
 from kivy.metrics import dp
-from kivy.uix.screenmanager import ScreenManager
 from kivymd.app import MDApp
 from kivymd.uix.boxlayout import MDBoxLayout
 from kivymd.uix.toolbar import MDTopAppBar
-from kivymd.uix.button import MDIconButton
 from kivymd.uix.card import MDCard
 from kivymd.uix.fitimage import FitImage
 from kivymd.uix.relativelayout import MDRelativeLayout
 
-from ponsiv.components.image_icon import ImageToggleButton, icon_path
+from ponsiv.components.image_icon import ImageToggleButton, icon_source
 
-from .screens.feed import FeedScreen
-from .screens.explore import ExploreScreen
-from .screens.looks import LooksScreen
-from .screens.cart import CartScreen
-from .screens.profile import ProfileScreen
-from .screens.login import LoginScreen
-from .screens.detail import ProductDetailScreen
-from .store import store
+from .screens.registry import LazyScreenManager
+from .store import is_logged_in, shutdown, warm_up
 
 Window.size = (360, 640)
 
@@ -43,8 +35,8 @@ class BottomBar(MDCard):
 
         self.buttons = {}
         for name in items:
-            normal = icon_path("nav", name, "normal")
-            selected = icon_path("nav", name, "selected")
+            normal = icon_source("nav", name, "normal")
+            selected = icon_source("nav", name, "selected")
 
             if normal:
                 btn = ImageToggleButton(
@@ -89,6 +81,8 @@ class BottomBar(MDCard):
 
 class PonsivApp(MDApp):
     def build(self):
+        # El catálogo se carga en segundo plano mientras se monta la interfaz
+        warm_up()
         self.theme_cls.theme_style = "Light"
 
         root = MDBoxLayout(orientation="vertical")
@@ -130,10 +124,10 @@ class PonsivApp(MDApp):
             spacing=dp(8),
         )
 
-        from ponsiv.components.image_icon import ImageToggleButton, icon_path
+        from ponsiv.components.image_icon import ImageToggleButton, icon_source
 
         def _img_btn(group, name, on_press):
-            src = icon_path(group, name, "normal")
+            src = icon_source(group, name, "normal")
             if src:
                 b = ImageToggleButton(
                     normal_source=src,
@@ -161,19 +155,13 @@ class PonsivApp(MDApp):
         root.add_widget(self.top_container)
 
         # ── Screens ─────────────────────────────────────────────────────────────
-        self.sm = ScreenManager()
+        # Cada pantalla (y su módulo) se crea la primera vez que se navega a ella
+        self.sm = LazyScreenManager()
         self.sm.size_hint_y = 1
-        self.sm.add_widget(FeedScreen(name="feed"))
-        self.sm.add_widget(ExploreScreen(name="explore"))
-        self.sm.add_widget(LooksScreen(name="looks"))
-        self.sm.add_widget(CartScreen(name="cart"))
-        self.sm.add_widget(ProfileScreen(name="profile"))
-        self.sm.add_widget(LoginScreen(name="login"))
-        self.sm.add_widget(ProductDetailScreen(name="detail"))
         root.add_widget(self.sm)
 
-        # Pantalla inicial
-        if store.current_user_id is None:
+        # Pantalla inicial (sin esperar al catálogo, que se sigue cargando)
+        if not is_logged_in():
             self.sm.current = "login"
         else:
             self.sm.current = "feed"
@@ -188,6 +176,10 @@ class PonsivApp(MDApp):
 
         return root
 
+    def on_stop(self):
+        # Vuelca los likes pendientes antes de salir
+        shutdown()
+
     def switch_screen(self, name: str) -> None:
         self.sm.current = name
         # update_chrome se dispara también por el bind, pero lo llamamos por si acaso
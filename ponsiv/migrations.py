@@ -0,0 +1,141 @@
+import sqlite3
+from typing import Callable, List
+
+from .db import Database
+
+
+def _columns(conn: sqlite3.Connection, table: str) -> set:
+    return {row["name"] for row in conn.execute(f"PRAGMA table_info({table})")}
+
+
+def _add_columns(conn: sqlite3.Connection, table: str, columns: dict) -> None:
+    existing = _columns(conn, table)
+    for col, sql_type in columns.items():
+        if col not in existing:
+            conn.execute(f"ALTER TABLE {table} ADD COLUMN {col} {sql_type}")
+
+
+# ------------------------------------------------------------- Migraciones --
+# Cada migración lleva el esquema de la versión i a la i+1. Las bases de datos
+# anteriores al control de versiones (user_version = 0) pueden tener ya parte
+# del esquema, por eso las primeras comprueban lo que existe.
+
+def _v1_base_schema(conn: sqlite3.Connection) -> None:
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS users (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            email TEXT UNIQUE NOT NULL,
+            password_hash TEXT NOT NULL,
+            name TEXT,
+            handle TEXT,
+            avatar_path TEXT
+        )
+        """
+    )
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS likes (
+            user_id INTEGER NOT NULL,
+            product_id TEXT NOT NULL,
+            UNIQUE(user_id, product_id)
+        )
+        """
+    )
+    _add_columns(conn, "users", {"age": "INTEGER", "city": "TEXT", "sex": "TEXT"})
+    # Momento del like (epoch); NULL en likes anteriores a esta columna
+    _add_columns(conn, "likes", {"created_at": "REAL"})
+
+
+def _v2_like_counts(conn: sqlite3.Connection) -> None:
+    """Materialized ``like_counts``, filled from ``likes`` and kept by triggers."""
+    exists = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type='table' AND name='like_counts'"
+    ).fetchone()
+    if exists is None:
+        conn.execute(
+            """
+            CREATE TABLE like_counts (
+                product_id TEXT PRIMARY KEY,
+                count INTEGER NOT NULL DEFAULT 0
+            ) WITHOUT ROWID
+            """
+        )
+        conn.execute(
+            """
+            INSERT INTO like_counts (product_id, count)
+            SELECT product_id, COUNT(*) FROM likes GROUP BY product_id
+            """
+        )
+    conn.execute(
+        """
+        CREATE TRIGGER IF NOT EXISTS likes_count_insert AFTER INSERT ON likes
+        BEGIN
+            INSERT INTO like_counts (product_id, count) VALUES (NEW.product_id, 1)
+            ON CONFLICT(product_id) DO UPDATE SET count = count + 1;
+        END
+        """
+    )
+    conn.execute(
+        """
+        CREATE TRIGGER IF NOT EXISTS likes_count_delete AFTER DELETE ON likes
+        BEGIN
+            UPDATE like_counts SET count = count - 1 WHERE product_id = OLD.product_id;
+        END
+        """
+    )
+
+
+def _v3_indexes(conn: sqlite3.Connection) -> None:
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_users_handle ON users (handle)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_likes_product ON likes (product_id)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_likes_created ON likes (created_at)")
+
+
+def _v4_likes_recent_index(conn: sqlite3.Connection) -> None:
+    """Covering index for the trending load (likes newer than a date, by product)."""
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_likes_created_product ON likes (created_at, product_id)"
+    )
+    # Queda cubierto por el nuevo (mismo prefijo)
+    conn.execute("DROP INDEX IF EXISTS idx_likes_created")
+
+
+# Orden fijo: añadir al final, nunca reordenar ni editar las ya publicadas
+MIGRATIONS: List[Callable[[sqlite3.Connection], None]] = [
+    _v1_base_schema,
+    _v2_like_counts,
+    _v3_indexes,
+    _v4_likes_recent_index,
+]
+SCHEMA_VERSION = len(MIGRATIONS)
+
+
+def schema_version(db: Database) -> int:
+    return db.query_one("PRAGMA user_version")[0]
+
+
+def migrate(db: Database) -> int:
+    """Bring the database up to :data:`SCHEMA_VERSION`; return the old version.
+
+    When the schema is current this is a single ``PRAGMA user_version``
+    read. Otherwise each pending migration runs in its own transaction
+    together with the version bump, so a failure leaves the database at the
+    last complete version.
+    """
+    current = schema_version(db)
+    if current >= SCHEMA_VERSION:
+        return current
+    start = current
+    while current < SCHEMA_VERSION:
+        with db.writer() as conn:
+            # BEGIN explícito: sqlite3 no abre transacción antes de DDL.
+            # IMMEDIATE toma el bloqueo de escritura antes de releer la versión.
+            conn.execute("BEGIN IMMEDIATE")
+            current = conn.execute("PRAGMA user_version").fetchone()[0]
+            if current >= SCHEMA_VERSION:
+                break
+            MIGRATIONS[current](conn)
+            current += 1
+            conn.execute(f"PRAGMA user_version = {current}")
+    return start
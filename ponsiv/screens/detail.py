@@ -9,11 +9,18 @@ from ..store import store
 class ProductDetailScreen(MDScreen):
     """Muestra un producto en grande con la misma UI del feed (ProductSlide)."""
 
+    _slide = None
+
     def show_product(self, product_id: str):
+        # La imagen anterior queda reservada en la caché si no se suelta
+        if self._slide is not None:
+            self._slide.release()
+            self._slide = None
         self.clear_widgets()
         product = store.products.get(product_id)
         if not product:
             return
         root = MDBoxLayout(orientation="vertical")
-        root.add_widget(ProductSlide(product, size_hint=(1, 1)))
+        self._slide = ProductSlide(product, size_hint=(1, 1))
+        root.add_widget(self._slide)
         self.add_widget(root)
@@ -1,5 +1,7 @@
 from pathlib import Path
 import random
+from concurrent.futures import ThreadPoolExecutor
+from kivy.clock import Clock
 from kivy.metrics import dp
 from kivy.uix.scrollview import ScrollView
 from kivy.uix.floatlayout import FloatLayout
@@ -14,7 +16,9 @@ from kivymd.uix.chip import MDChip
 from kivymd.uix.textfield import MDTextField
 
 from ..store import store
-from ponsiv.components.image_icon import single_icon_path
+from ponsiv.components.image_icon import single_icon_source
+from ponsiv.components.product_grid import ProductGrid
+from ponsiv.components.cached_image import CachedImage
 
 IOS_BG = (0.965, 0.973, 0.985, 1)
 IOS_TEXT = (0, 0, 0, 1)
@@ -25,6 +29,60 @@ CHIP_BG_ACTIVE = (0.85, 0.88, 0.92, 1)
 # Qué consideramos "verano"
 SUMMER_CATS = ("Vestidos", "Camisetas", "Tops", "Bermudas")
 
+# Espera tras la última tecla antes de filtrar (segundos)
+SEARCH_DEBOUNCE = 0.15
+# Máximo de productos en "Tendencias del momento" (solo sin filtros)
+TRENDING_LIMIT = 60
+
+
+class SearchPipeline:
+    """
+    Ejecuta filtrado + ranking en un hilo de trabajo:
+      - `submit(...)` con debounce (las teclas seguidas se agrupan)
+      - cada petición nueva deja obsoletas las anteriores, que se descartan
+      - solo el resultado de la última se publica, en el hilo de Kivy (Clock)
+    """
+
+    def __init__(self, compute, publish, delay: float = SEARCH_DEBOUNCE):
+        self._compute = compute
+        self._publish = publish
+        self._generation = 0
+        self._pending = None
+        self._future = None
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ponsiv-search")
+        self._trigger = Clock.create_trigger(self._dispatch, delay)
+
+    def submit(self, *args, debounce: bool = True) -> None:
+        self._generation += 1
+        self._pending = (self._generation, args)
+        self._trigger.cancel()
+        if debounce:
+            self._trigger()
+        else:
+            self._dispatch()
+
+    def _dispatch(self, *_):
+        if self._pending is None:
+            return
+        generation, args = self._pending
+        self._pending = None
+        if self._future is not None:
+            self._future.cancel()  # solo cancela si aún no ha empezado
+        self._future = self._executor.submit(self._run, generation, args)
+
+    def _run(self, generation: int, args) -> None:
+        if generation != self._generation:
+            return
+        result = self._compute(*args)
+        if generation != self._generation:
+            return
+        Clock.schedule_once(lambda _dt: self._deliver(generation, result))
+
+    def _deliver(self, generation: int, result) -> None:
+        if generation == self._generation:
+            self._publish(result)
+
+
 
 class ExploreScreen(MDScreen):
     def on_pre_enter(self, *args):
@@ -101,7 +159,7 @@ class ExploreScreen(MDScreen):
             padding=(dp(10), 0),
         )
         row = MDBoxLayout(orientation="horizontal", spacing=dp(6))
-        lupa_src = single_icon_path("search", "magnify")
+        lupa_src = single_icon_source("search", "magnify")
         if lupa_src:
             row.add_widget(FitImage(source=lupa_src, size_hint=(None, None), size=(dp(22), dp(22))))
         else:
@@ -120,7 +178,7 @@ class ExploreScreen(MDScreen):
             self.search_tf.fill_color_focus = IOS_BG
         except Exception:
             pass
-        self.search_tf.bind(text=lambda *_: self._apply_active_filters())
+        self.search_tf.bind(text=lambda *_: self._apply_active_filters(debounce=True))
         row.add_widget(self.search_tf)
         search_card.add_widget(row)
         content_wrap.add_widget(search_card)
@@ -157,11 +215,16 @@ class ExploreScreen(MDScreen):
 
         # ---------- TENDENCIAS ----------
         content_wrap.add_widget(self._section_title("Tendencias del momento"))
-        self.trend_scroll = ScrollView(size_hint=(1, None), height=dp(200), do_scroll_y=False)
-        self.trend_row = MDBoxLayout(orientation="horizontal", spacing=dp(10), padding=(dp(2), 0), size_hint_x=None)
-        self.trend_row.bind(minimum_width=self.trend_row.setter("width"))
-        self.trend_scroll.add_widget(self.trend_row)
-        content_wrap.add_widget(self.trend_scroll)
+        # Fila virtualizada: solo existen las tarjetas visibles (+ overscan)
+        self.trend_grid = ProductGrid(
+            on_open=self._open_detail,
+            orientation="horizontal",
+            item_size=(dp(120), dp(180)),
+            padding=(dp(2), dp(10)),
+            size_hint=(1, None),
+            height=dp(200),
+        )
+        content_wrap.add_widget(self.trend_grid)
 
         # separador fino
         content_wrap.add_widget(self._hairline())
@@ -176,6 +239,9 @@ class ExploreScreen(MDScreen):
 
         self._render_categories_dynamic()
 
+        # Filtrado/ranking fuera del hilo de UI
+        self._search = SearchPipeline(self._filter_and_rank, self._render_trending)
+
         # primera carga
         self._apply_active_filters()
         self._initialized = True
@@ -211,30 +277,16 @@ class ExploreScreen(MDScreen):
         return None
 
     def _render_trending(self, products):
-        from kivymd.uix.card import MDCard
-        self.trend_row.clear_widgets()
-        for p in products:
-            card = MDCard(size_hint=(None, None), size=(dp(120), dp(180)),
-                          radius=[dp(12)], elevation=0, md_bg_color=(1, 1, 1, 1))
-            v = MDBoxLayout(orientation="vertical")
-            if p.images:
-                v.add_widget(FitImage(source=p.images[0], size_hint=(1, 1)))
-            else:
-                v.add_widget(MDLabel(text="Sin imagen", halign="center"))
-            info = MDBoxLayout(orientation="vertical", size_hint=(1, None), height=dp(54), padding=(dp(8), dp(6)))
-            info.add_widget(MDLabel(text=p.brand or "", font_size="12sp",
-                                    theme_text_color="Custom", text_color=(0, 0, 0, 0.9)))
-            info.add_widget(MDLabel(text=f"{p.price:.2f} €", font_size="13sp", bold=True,
-                                    theme_text_color="Custom", text_color=(0, 0, 0, 1)))
-            v.add_widget(info)
-            card.add_widget(v)
-            card.bind(on_touch_up=lambda inst, touch, pid=p.id: self._open_detail_if_hit(inst, touch, pid))
-            self.trend_row.add_widget(card)
+        self.trend_grid.set_products(products)
 
     def _render_categories_dynamic(self):
         """Dibuja categorías a partir del campo 'categoria' de los JSON y
         usa una IMAGEN ALEATORIA de un producto de esa categoría."""
         from kivymd.uix.card import MDCard
+        # Suelta las texturas de las miniaturas anteriores antes de rehacerlas
+        for img in getattr(self, "_cat_images", ()):
+            img.release()
+        self._cat_images = []
         self.cat_row.clear_widgets()
         cats = store.get_categories()
         if not cats:
@@ -246,7 +298,10 @@ class ExploreScreen(MDScreen):
             wrap = MDBoxLayout(orientation="vertical", size_hint=(None, None), size=(dp(82), dp(110)))
             box = MDCard(size_hint=(1, None), height=dp(78), radius=[dp(14)], elevation=0, md_bg_color=(1, 1, 1, 1))
             if thumb:
-                box.add_widget(FitImage(source=thumb, size_hint=(1, 1)))
+                img = CachedImage(size_hint=(1, 1))
+                img.show(thumb, dp(82))
+                self._cat_images.append(img)
+                box.add_widget(img)
             wrap.add_widget(box)
             wrap.add_widget(MDLabel(text=cat, halign="center", font_size="12sp",
                                     theme_text_color="Custom", text_color=(0, 0, 0, 0.9),
@@ -281,36 +336,29 @@ class ExploreScreen(MDScreen):
         self._selected_category = None  # si tocas chip, sales de un filtro de categoría
         self._apply_active_filters()
 
-    def _apply_active_filters(self):
-        items = list(store.products.values())
-
-        # 1) Filtro por categoría elegida (banner o tarjeta)
-        if self._selected_category:
-            if self._selected_category == "__summer__":
-                items = [p for p in items if (p.category in SUMMER_CATS)]
-            else:
-                items = [p for p in items if (p.category == self._selected_category)]
+    def _apply_active_filters(self, debounce: bool = False):
+        """Lanza el filtrado con el estado actual; el resultado llega por Clock."""
+        # 1) Categoría elegida (banner o tarjeta); si no hay, 2) palabras del chip
+        if self._selected_category == "__summer__":
+            cats, kws = SUMMER_CATS, ()
+        elif self._selected_category:
+            cats, kws = (self._selected_category,), ()
         else:
-            # 2) Chips (si no hay categoría activa)
-            kws = self._chip_filters.get(self._active_chip or "Todos", [])
-            if kws:
-                up = lambda s: (s or "").upper()
-                items = [p for p in items if any(k in up(p.title) for k in kws)]
-
+            cats, kws = None, tuple(self._chip_filters.get(self._active_chip or "Todos", []))
         # 3) Texto búsqueda
-        q = (self.search_tf.text or "").strip().lower()
-        if q:
-            items = [p for p in items if q in (p.title or "").lower() or q in (p.brand or "").lower()]
-
-        # 4) Ordenar por likes
-        items = store.sort_products_by_likes(items)
-        self._render_trending(items)
-
-    def _open_detail_if_hit(self, widget, touch, product_id: str):
-        if widget.collide_point(*touch.pos):
-            detail = self.manager.get_screen("detail")
-            detail.show_product(product_id)
-            self.manager.current = "detail"
-            return True
-        return False
+        self._search.submit(self.search_tf.text or "", cats, kws, debounce=debounce)
+
+    @staticmethod
+    def _filter_and_rank(query, cats, kws):
+        """Se ejecuta en el hilo de búsqueda: solo índices y lecturas."""
+        items = store.search_products(query, categories=cats, keywords=kws)
+        # 4) Top por likes recientes (con decaimiento temporal); con búsqueda,
+        # chip o categoría activos se ordenan todos los resultados sin recortar
+        unfiltered = not query.strip() and not cats and not kws
+        return store.trending_products(items, k=TRENDING_LIMIT if unfiltered else None)
+
+    def _open_detail(self, product_id: str):
+        detail = self.manager.get_screen("detail")
+        detail.show_product(product_id)
+        self.manager.current = "detail"
 
@@ -1,81 +1,124 @@
 import random
 
+from kivy.clock import Clock
 from kivy.uix.carousel import Carousel
 from kivymd.uix.screen import MDScreen
-from ..components.product_slide import ProductSlide
+from ..components.product_slide import ProductSlide, slide_image
+from ..texture_cache import texture_cache
 from ..store import store
 
+# Nº de slides vivos en el carrusel (impar: el actual queda en el centro)
+POOL_SIZE = 5
+# Imágenes a precargar por delante / por detrás según el sentido del swipe
+PREFETCH_AHEAD = 4
+PREFETCH_BEHIND = 2
+
 
 class FeedScreen(MDScreen):
     """
-    Feed con scroll infinito:
-      - Cada 'vuelta' es una permutación aleatoria de todos los productos.
-      - Poda de memoria: mantenemos como mucho `max_chunks` vueltas en el carrusel.
+    Feed con scroll infinito sobre un anillo fijo de `POOL_SIZE` slides:
+      - El orden es una sucesión de 'vueltas', cada una una permutación
+        aleatoria de todos los productos (solo se guardan ids).
+      - Al deslizar, el slide que sale por un extremo se mueve al otro y se
+        reenlaza al siguiente producto: no se crean widgets al hacer swipe y
+        la memoria no depende del tamaño del catálogo.
+      - Las imágenes de las próximas posiciones (en el sentido del swipe) se
+        decodifican por adelantado en segundo plano.
     """
     def on_pre_enter(self, *args):
         if hasattr(self, "_initialized") and self._initialized:
+            for slide in getattr(self, "_slides", ()):
+                slide.refresh_like()
             return
 
         self.carousel = Carousel(direction="bottom", loop=False, size_hint=(1, 1))
         self.add_widget(self.carousel)
 
-        # --- Parámetros de ventana/memoria ---
-        self.chunk_size = max(1, len(store.products))  # nº de slides por vuelta
-        self.max_chunks = 3                            # mantén 3 vueltas en memoria (ajústalo)
-        self._chunks_loaded = 0
-
-        # Semilla inicial: dos vueltas para suavidad
-        self._append_random_chunk()
-        self._append_random_chunk()
+        self._order = []   # ids en orden de aparición
+        self._start = 0    # posición en _order del primer slide del carrusel
+        self._slides = []
+        self._direction = 1  # +1 hacia delante, -1 hacia atrás
+        for pos in range(POOL_SIZE):
+            product = self._product_at(pos)
+            if product is None:
+                break
+            slide = ProductSlide(product, size_hint=(1, 1))
+            self._slides.append(slide)
+            self.carousel.add_widget(slide)
 
-        # Extiende cuando te acerques al final
-        self.carousel.bind(index=self._maybe_extend)
+        self._recenter_trigger = Clock.create_trigger(self._recenter)
+        self.carousel.bind(index=lambda *_: self._recenter_trigger())
+        self._prefetch()
 
         self._initialized = True
 
-    # ---------- lógica de "vuelta" aleatoria ----------
-    def _append_random_chunk(self):
-        """Añade una vuelta (todos los productos barajados) al final."""
-        items = list(store.products.values())
-        if not items:
-            return
-        random.shuffle(items)
-        for product in items:
-            self.carousel.add_widget(ProductSlide(product, size_hint=(1, 1)))
-
-        self._chunks_loaded += 1
-        self._prune_if_needed()
+    # ---------- orden aleatorio por 'vueltas' ----------
+    def _product_at(self, pos: int):
+        """Producto en la posición `pos` del feed; añade vueltas si hace falta."""
+        while pos >= len(self._order):
+            ids = list(store.products)
+            if not ids:
+                return None
+            random.shuffle(ids)
+            self._order.extend(ids)
+        return store.products.get(self._order[pos])
 
-    def _maybe_extend(self, *_):
-        """Cuando queden 2 slides para el final, añade otra vuelta."""
-        total = len(self.carousel.slides)
-        idx = self.carousel.index
-        if total - idx <= 2:
-            self._append_random_chunk()
-
-    # ---------- poda de memoria ----------
-    def _prune_if_needed(self):
+    # ---------- rotación del anillo ----------
+    def _recenter(self, *_):
         """
-        Si hay más de `max_chunks` vueltas cargadas, elimina la más antigua (primer bloque).
-        Evita podar si el usuario aún está dentro de ese primer bloque.
+        Mantiene el slide actual en el centro del anillo moviendo slides de un
+        extremo al otro (y reenlazándolos) tras cada swipe.
         """
-        # Mientras nos pasemos de la ventana permitida…
-        while self._chunks_loaded > self.max_chunks:
-            # Si el usuario está aún en el primer bloque, no podar (evita tirones).
-            if self.carousel.index < self.chunk_size:
-                # Salimos y ya se podará en el siguiente avance
-                return
+        carousel = self.carousel
+        slides = carousel.slides
+        if len(slides) < POOL_SIZE:
+            return
+        center = POOL_SIZE // 2
+        if carousel.index != center:
+            self._direction = 1 if carousel.index > center else -1
+
+        # Hacia delante: el primero pasa al final con el producto siguiente.
+        # remove_widget ya corre el índice una posición hacia atrás.
+        while carousel.index > center:
+            slide = slides[0]
+            carousel.remove_widget(slide)
+            slide.bind_product(self._product_at(self._start + POOL_SIZE))
+            carousel.add_widget(slide)
+            self._start += 1
+
+        # Hacia atrás: el último pasa al principio con el producto anterior
+        while carousel.index < center and self._start > 0:
+            slide = slides[-1]
+            carousel.remove_widget(slide)
+            self._start -= 1
+            slide.bind_product(self._product_at(self._start))
+            carousel.add_widget(slide, index=len(carousel.slides))
+            carousel.index += 1
 
-            # Elimina el bloque más antiguo (primeros `chunk_size` slides)
-            old_index = self.carousel.index
-            for _ in range(min(self.chunk_size, len(self.carousel.slides))):
-                # defensivo: puede haber menos slides en estados intermedios
-                if not self.carousel.slides:
-                    break
-                self.carousel.remove_widget(self.carousel.slides[0])
+        self._trim_history()
+        self._prefetch()
 
-            # Recoloca el índice para seguir mostrando el mismo contenido lógico
-            # (se ha corrido hacia atrás exactamente chunk_size posiciones).
-            self.carousel.index = max(0, old_index - self.chunk_size)
-            self._chunks_loaded -= 1
+    def _prefetch(self):
+        """Precarga las imágenes cercanas: PREFETCH_AHEAD en el sentido del swipe
+        y PREFETCH_BEHIND en el contrario, de la más próxima a la más lejana."""
+        pos = self._start + self.carousel.index
+        d = self._direction
+        nearest = []
+        for step in range(1, max(PREFETCH_AHEAD, PREFETCH_BEHIND) + 1):
+            if step <= PREFETCH_AHEAD:
+                nearest.append(pos + step * d)
+            if step <= PREFETCH_BEHIND:
+                nearest.append(pos - step * d)
+        cache = texture_cache()
+        for p in nearest:
+            product = self._product_at(p) if p >= 0 else None
+            if product is not None:
+                cache.prefetch(*slide_image(product))
 
+    def _trim_history(self):
+        """Olvida ids muy antiguos: se conserva como mucho una vuelta hacia atrás."""
+        keep_back = max(POOL_SIZE, len(store.products))
+        drop = self._start - keep_back
+        if drop > 0:
+            del self._order[:drop]
+            self._start -= drop
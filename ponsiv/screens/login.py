@@ -1,3 +1,6 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from kivy.clock import Clock
 from kivy.metrics import dp
 from kivy.uix.gridlayout import GridLayout
 from kivy.uix.anchorlayout import AnchorLayout
@@ -10,7 +13,6 @@ from kivymd.uix.fitimage import FitImage
 from kivymd.uix.textfield import MDTextField
 from kivymd.uix.button import MDRaisedButton, MDFlatButton
 from kivymd.uix.label import MDLabel
-from kivymd.uix.chip import MDChip
 
 from ..store import store
 
@@ -19,6 +21,15 @@ IOS_TEXT = (0, 0, 0, 1)
 IOS_SUBTEXT = (0, 0, 0, 0.55)
 IOS_CARD = (1, 1, 1, 1)
 
+# El hash de contraseñas (PBKDF2) es lento a propósito: se hace fuera del hilo de Kivy
+_auth_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ponsiv-auth")
+
+
+def run_auth(fn, *args, on_done, **kwargs) -> None:
+    """Run ``fn`` on the auth worker and call ``on_done(future)`` on the Kivy thread."""
+    future = _auth_executor.submit(fn, *args, **kwargs)
+    future.add_done_callback(lambda f: Clock.schedule_once(lambda _dt: on_done(f)))
+
 
 class LoginScreen(MDScreen):
     """
@@ -28,6 +39,7 @@ class LoginScreen(MDScreen):
       - Registro con Edad / Ciudad / Sexo
     """
     mode = "login"  # 'login' | 'signup'
+    busy = False     # hay una autenticación en curso
 
     def on_pre_enter(self, *args):
         self.clear_widgets()
@@ -104,6 +116,7 @@ class LoginScreen(MDScreen):
         # Botón
         btn = MDRaisedButton(text="Iniciar sesión", size_hint=(1, None), height=dp(44),
                              on_release=self.handle_login)
+        self.submit_btn = btn
 
         # Montaje
         wrap.add_widget(email_card)
@@ -116,6 +129,9 @@ class LoginScreen(MDScreen):
         return wrap
 
     def _build_signup_form(self):
+        # Solo el registro usa chips: se importan al abrirlo, no al arrancar
+        from kivymd.uix.chip import MDChip
+
         wrap = MDBoxLayout(orientation="vertical", spacing=dp(8), size_hint=(1, None))
 
         # NUEVOS campos
@@ -155,6 +171,7 @@ class LoginScreen(MDScreen):
 
         btn = MDRaisedButton(text="Crear cuenta", size_hint=(1, None), height=dp(44),
                              on_release=self.handle_signup)
+        self.submit_btn = btn
 
         # Montaje
         wrap.add_widget(name_card)
@@ -173,7 +190,7 @@ class LoginScreen(MDScreen):
 
     # ───────────── render / toggle ─────────────
     def _switch(self, mode: str):
-        if mode == self.mode:
+        if mode == self.mode or self.busy:
             return
         self.mode = mode
         self._render()
@@ -201,20 +218,45 @@ class LoginScreen(MDScreen):
         # 3) limpiar mensajes
         self.message.text = ""
 
+    def _set_busy(self, busy: bool, text: str = "") -> None:
+        """Bloquea el formulario mientras el worker calcula el hash."""
+        self.busy = busy
+        btn = self.submit_btn
+        if busy:
+            self._idle_text = btn.text
+            btn.text = text
+        else:
+            btn.text = getattr(self, "_idle_text", btn.text)
+        btn.disabled = busy
+        self.btn_tab_login.disabled = busy or self.mode == "login"
+        self.btn_tab_signup.disabled = busy or self.mode == "signup"
+
     # ───────────── acciones ─────────────
-    def _select_sex(self, chip: MDChip, value: str):
+    def _select_sex(self, chip, value: str):
         for c in self.sex_chips:
             c.active = (c is chip)
         self.sex_value = value
 
     def handle_login(self, *_):
+        if self.busy:
+            return
         email = (self.login_email.text or "").strip()
         password = self.login_password.text or ""
         if not email or not password:
             self.message.text = "Introduce email y contraseña."
             return
 
-        user_id = store.authenticate_user(email, password)
+        self.message.text = ""
+        self._set_busy(True, "Entrando…")
+        run_auth(store.authenticate_user, email, password,
+                 on_done=lambda f: self._on_login_done(f, email))
+
+    def _on_login_done(self, future, email: str):
+        self._set_busy(False)
+        if future.exception() is not None:
+            self.message.text = "No se pudo iniciar sesión. Inténtalo de nuevo."
+            return
+        user_id = future.result()
         if user_id is None:
             if store.get_user_by_email(email) is not None:
                 self.message.text = "Contraseña incorrecta."
@@ -226,6 +268,8 @@ class LoginScreen(MDScreen):
         self.manager.current = "feed"
 
     def handle_signup(self, *_):
+        if self.busy:
+            return
         name = (self.signup_name.text or "").strip()
         handle = (self.signup_handle.text or "").strip().lstrip("@")
         email = (self.signup_email.text or "").strip()
@@ -258,10 +302,19 @@ class LoginScreen(MDScreen):
 
         age = int(age_txt) if age_txt.isdigit() else None
 
-        user_id = store.create_user(
-            email, password,
+        self.message.text = ""
+        self._set_busy(True, "Creando cuenta…")
+        run_auth(
+            store.create_user, email, password,
             name=name, handle=handle,
-            age=age, city=city or None, sex=sex or None
+            age=age, city=city or None, sex=sex or None,
+            on_done=self._on_signup_done,
         )
-        store.current_user_id = user_id
+
+    def _on_signup_done(self, future):
+        self._set_busy(False)
+        if future.exception() is not None:
+            self.message.text = "No se pudo crear la cuenta. Inténtalo de nuevo."
+            return
+        store.current_user_id = future.result()
         self.manager.current = "feed"
@@ -1,7 +1,6 @@
 # ponsiv/screens/profile.py
 from kivy.metrics import dp
-from kivy.uix.scrollview import ScrollView
-from kivy.uix.gridlayout import GridLayout
+from kivy.uix.widget import Widget
 
 from kivymd.uix.screen import MDScreen
 from kivymd.uix.boxlayout import MDBoxLayout
@@ -9,21 +8,36 @@ from kivymd.uix.card import MDCard
 from kivymd.uix.label import MDLabel
 from kivymd.uix.fitimage import FitImage
 from kivymd.uix.button import MDIconButton
-from ponsiv.components.image_icon import ImageToggleButton, icon_path
+from ponsiv.components.image_icon import ImageToggleButton, icon_source
+from ponsiv.components.product_grid import ProductGrid, ProductGridCard
 
 from ..store import store
 
+DEFAULT_AVATAR = "assets/logos/Ponsiv.png"
+
+
+class LikedProductCard(ProductGridCard):
+    """Tarjeta grande para el grid de 2 columnas: imagen alta + franja inferior."""
+
+    def __init__(self, **kwargs):
+        # El ancho real depende de la columna; basta una cota para la miniatura
+        super().__init__(radius=[dp(16)], info_height=dp(56), info_padding=(dp(10), dp(6)),
+                         brand_color=(0, 0, 0, 0.8), image_width=dp(180), **kwargs)
+
 
 class ProfileScreen(MDScreen):
-    """Perfil estilo iOS con grid de 'likes' y detalle on tap."""
+    """
+    Perfil estilo iOS con grid de 'likes' y detalle on tap.
+    El árbol de widgets se construye una vez; en cada entrada solo se aplican
+    los cambios (likes añadidos/quitados, nombre, handle, avatar).
+    """
 
     def on_pre_enter(self, *args):
-        self.clear_widgets()
-
-        user = store.get_user(store.current_user_id) if store.current_user_id else None
-        likes = store.get_liked_product_ids(store.current_user_id) if store.current_user_id else []
-        outfits_count = len(likes)
+        if not getattr(self, "_built", False):
+            self._build()
+        self._refresh()
 
+    def _build(self):
         root = MDBoxLayout(orientation="vertical", padding=(dp(16), dp(8)), spacing=dp(8))
 
         # ── Encabezado:  Foto, nombre, handle (en ese orden), todo centrado ──
@@ -33,33 +47,32 @@ class ProfileScreen(MDScreen):
         # Foto (avatar) debajo
         avatar_wrap = MDCard(size_hint=(None, None), size=(dp(70), dp(70)),
                              radius=[dp(45)], elevation=0, md_bg_color=(1, 1, 1, 1))
-        if user and user.avatar_path:
-            avatar_wrap.add_widget(FitImage(source=user.avatar_path))
-        else:
-            avatar_wrap.add_widget(FitImage(source="assets/logos/Ponsiv.png"))
+        self.avatar_image = FitImage(source=DEFAULT_AVATAR)
+        avatar_wrap.add_widget(self.avatar_image)
         avatar_row = MDBoxLayout(orientation="horizontal", size_hint=(1, None), height=dp(100))
         avatar_row.add_widget(MDBoxLayout(size_hint_x=1))
         avatar_row.add_widget(avatar_wrap)
         avatar_row.add_widget(MDBoxLayout(size_hint_x=1))
         header.add_widget(avatar_row)
 
-        name = (user.name if (user and user.name) else "Usuario")
-        handle = f"@{(user.handle if user and user.handle else 'ponsiver')}"
-
-        header.add_widget(MDLabel(
-            text=name, halign="center", font_size="20sp", bold=True,
+        self.name_label = MDLabel(
+            text="", halign="center", font_size="20sp", bold=True,
             theme_text_color="Custom", text_color=(0, 0, 0, 1)
-        ))
-        header.add_widget(MDLabel(
-            text=handle, halign="center", font_size="13sp",
+        )
+        self.handle_label = MDLabel(
+            text="", halign="center", font_size="13sp",
             theme_text_color="Custom", text_color=(0, 0, 0, 0.65)
-        ))
+        )
+        header.add_widget(self.name_label)
+        header.add_widget(self.handle_label)
 
 
         # Métricas
         metrics = MDBoxLayout(orientation="horizontal", size_hint=(1, None), height=dp(40),
                               spacing=dp(16), padding=(dp(16), 0))
-        metrics.add_widget(self._metric_column(outfits_count if outfits_count else 0, "Outfits"))
+        outfits = self._metric_column(0, "Outfits")
+        self.outfits_label = outfits.children[-1]
+        metrics.add_widget(outfits)
         metrics.add_widget(self._metric_column(0, "Siguiendo"))
         metrics.add_widget(self._metric_column(0, "Seguidores"))
         header.add_widget(metrics)
@@ -74,8 +87,8 @@ class ProfileScreen(MDScreen):
         self._tab_btns = []
         for name, active in _tab_names:
             group = "actions"
-            normal = icon_path(group, name if name != "file" else "file", "normal")
-            selected = icon_path(group, name if name != "file" else "file", "selected")
+            normal = icon_source(group, name if name != "file" else "file", "normal")
+            selected = icon_source(group, name if name != "file" else "file", "selected")
             if normal:
                 btn = ImageToggleButton(normal_source=normal, selected_source=selected or normal,
                                         selected=active, size_hint=(None, None), size=(dp(22), dp(22)))
@@ -92,59 +105,60 @@ class ProfileScreen(MDScreen):
             self._tab_btns.append(btn)
         root.add_widget(tabs)
 
-        # ── Grid de likes: 1 columna y tarjetas altas para ocupar más pantalla ──
-        scroll = ScrollView(size_hint=(1, 1))
-        grid = GridLayout(cols=2, padding=[dp(8), dp(8)], spacing=dp(10), size_hint_y=None)
-        grid.bind(minimum_height=grid.setter("height"))
-
-        for pid in likes:
-            product = store.products.get(pid)
-            if not product:
-                continue
-            grid.add_widget(self._product_card_big2col(product))
-
-        if not likes:
-            grid.add_widget(MDLabel(text="Aún no has dado like a ninguna prenda.",
-                                    size_hint_y=None, height=dp(40),
-                                    theme_text_color="Custom", text_color=(0, 0, 0, 0.6)))
-
-        scroll.add_widget(grid)
-        root.add_widget(scroll)
+        # ── Grid de likes: 2 columnas virtualizadas (solo tarjetas visibles) ──
+        # Se alterna con el mensaje de vacío sin reconstruir ninguno de los dos
+        self.grid = ProductGrid(on_open=self._open_detail, cols=2, item_size=(None, dp(280)),
+                                viewclass=LikedProductCard, size_hint=(1, 1))
+        self.empty = MDBoxLayout(orientation="vertical", padding=[dp(8), dp(8)])
+        self.empty.add_widget(MDLabel(text="Aún no has dado like a ninguna prenda.",
+                                      size_hint_y=None, height=dp(40),
+                                      theme_text_color="Custom", text_color=(0, 0, 0, 0.6)))
+        self.empty.add_widget(Widget())
+        self.likes_host = MDBoxLayout(orientation="vertical", size_hint=(1, 1))
+        root.add_widget(self.likes_host)
 
         self.add_widget(root)
+        self._shown_user = None
+        self._shown_likes = None
+        self._built = True
 
-    def _product_card_big2col(self, product) -> MDCard:
-        """
-        Tarjeta grande para grid de 2 columnas: imagen alta + franja inferior.
-        Más grande que la versión anterior (height ~ 280 dp).
-        """
-        card = MDCard(size_hint=(1, None), height=dp(280), radius=[dp(16)],
-                    elevation=0, md_bg_color=(1, 1, 1, 1))
-        box = MDBoxLayout(orientation="vertical")
-
-        # Imagen (ocupa la mayor parte)
-        if product.images:
-            box.add_widget(FitImage(source=product.images[0], size_hint=(1, 1)))
-        else:
-            box.add_widget(MDLabel(text="Sin imagen", halign="center"))
-
-        # Franja inferior (marca y precio)
-        info = MDBoxLayout(orientation="vertical", size_hint=(1, None), height=dp(56),
-                        padding=(dp(10), dp(6)))
-        info.add_widget(MDLabel(text=product.brand or "", font_size="12sp",
-                                theme_text_color="Custom", text_color=(0, 0, 0, 0.8)))
-        info.add_widget(MDLabel(text=f"{product.price:.2f} €", font_size="13sp", bold=True,
-                                theme_text_color="Custom", text_color=(0, 0, 0, 1)))
-        box.add_widget(info)
-
-        card.add_widget(box)
-
-        # Tap → detalle
-        card.bind(on_touch_up=lambda inst, touch, pid=product.id:
-                self._open_detail_if_hit(inst, touch, pid))
-        return card
-
+    # ───────────────────────── Actualización incremental ────────────────────────
+    def _refresh(self):
+        user_id = store.current_user_id
+        user = store.get_user(user_id) if user_id else None
 
+        name = (user.name if (user and user.name) else "Usuario")
+        handle = f"@{(user.handle if user and user.handle else 'ponsiver')}"
+        avatar = user.avatar_path if (user and user.avatar_path) else DEFAULT_AVATAR
+        shown = (name, handle, avatar)
+        if shown != self._shown_user:
+            self.name_label.text, self.handle_label.text = name, handle
+            self.avatar_image.source = avatar
+            self._shown_user = shown
+
+        likes = [pid for pid in (store.get_liked_product_ids(user_id) if user_id else [])
+                 if pid in store.products]
+        if likes != self._shown_likes:
+            self._apply_likes_diff(likes)
+            self._shown_likes = likes
+
+    def _apply_likes_diff(self, likes):
+        """Quita del grid los likes desaparecidos y añade los nuevos, sin tocar el resto."""
+        data = self.grid.data
+        current = set(likes)
+        for i in reversed(range(len(data))):
+            if data[i]["product"].id not in current:
+                del data[i]
+        shown = {entry["product"].id for entry in data}
+        added = [{"product": store.products[pid]} for pid in likes if pid not in shown]
+        if added:
+            data.extend(added)
+
+        self.outfits_label.text = str(len(likes))
+        widget = self.grid if likes else self.empty
+        if widget.parent is not self.likes_host:
+            self.likes_host.clear_widgets()
+            self.likes_host.add_widget(widget)
 
     # ───────────────────────── Helpers UI ───────────────────────────────────────
     def _metric_column(self, number: int, label: str) -> MDBoxLayout:
@@ -184,6 +198,11 @@ class ProfileScreen(MDScreen):
                   self._open_detail_if_hit(inst, touch, pid))
         return card
 
+    def _open_detail(self, product_id: str):
+        detail = self.manager.get_screen("detail")
+        detail.show_product(product_id)
+        self.manager.current = "detail"
+
     def _open_detail_if_hit(self, widget, touch, product_id: str):
         if widget.collide_point(*touch.pos):
             detail = self.manager.get_screen("detail")
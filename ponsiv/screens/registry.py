@@ -0,0 +1,41 @@
+import importlib
+
+from kivy.uix.screenmanager import ScreenManager
+
+# nombre -> (módulo, clase). El módulo (y los widgets de KivyMD que importa)
+# solo se carga cuando se navega a esa pantalla por primera vez.
+SCREENS = {
+    "feed": ("ponsiv.screens.feed", "FeedScreen"),
+    "explore": ("ponsiv.screens.explore", "ExploreScreen"),
+    "looks": ("ponsiv.screens.looks", "LooksScreen"),
+    "cart": ("ponsiv.screens.cart", "CartScreen"),
+    "profile": ("ponsiv.screens.profile", "ProfileScreen"),
+    "login": ("ponsiv.screens.login", "LoginScreen"),
+    "detail": ("ponsiv.screens.detail", "ProductDetailScreen"),
+}
+
+
+class LazyScreenManager(ScreenManager):
+    """
+    ScreenManager que crea cada pantalla registrada la primera vez que se pide,
+    ya sea con `current = nombre` o con `get_screen(nombre)`.
+    """
+
+    def __init__(self, registry=None, **kwargs):
+        super().__init__(**kwargs)
+        self.registry = dict(SCREENS if registry is None else registry)
+
+    def is_built(self, name: str) -> bool:
+        return super().has_screen(name)
+
+    def has_screen(self, name: str) -> bool:
+        return name in self.registry or super().has_screen(name)
+
+    def get_screen(self, name: str):
+        if name in self.registry and not self.is_built(name):
+            module, cls_name = self.registry[name]
+            screen_cls = getattr(importlib.import_module(module), cls_name)
+            screen = screen_cls(name=name)
+            self.add_widget(screen)
+            return screen
+        return super().get_screen(name)
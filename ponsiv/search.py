@@ -0,0 +1,101 @@
+import re
+import unicodedata
+from bisect import bisect_left
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from .models import Product
+
+FIELDS: Tuple[str, ...] = ("title", "brand", "category")
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+def fold(text: Optional[str]) -> str:
+    """Lowercase ``text`` and strip accents: ``"Pantalón"`` -> ``"pantalon"``."""
+    decomposed = unicodedata.normalize("NFKD", text or "")
+    return "".join(ch for ch in decomposed if not unicodedata.combining(ch)).lower()
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    return _TOKEN_RE.findall(fold(text))
+
+
+class TextIndex:
+    """Inverted index of accent-folded tokens with prefix lookups.
+
+    Each field keeps ``token -> {product ids}`` plus a lazily rebuilt sorted
+    token list, so a prefix is resolved with one ``bisect`` and a short walk
+    over the matching tokens instead of scanning every product.
+    """
+
+    def __init__(self) -> None:
+        self._reset()
+
+    def _reset(self) -> None:
+        self._postings: Dict[str, Dict[str, Set[str]]] = {f: {} for f in FIELDS}
+        self._sorted: Dict[str, Optional[List[str]]] = {f: None for f in FIELDS}
+
+    def rebuild(self, products: Iterable[Product]) -> None:
+        self._reset()
+        for p in products:
+            self.add(p)
+
+    def add(self, product: Product) -> None:
+        for field in FIELDS:
+            postings = self._postings[field]
+            for token in tokenize(getattr(product, field)):
+                ids = postings.get(token)
+                if ids is None:
+                    postings[token] = ids = set()
+                    self._sorted[field] = None
+                ids.add(product.id)
+
+    def remove(self, product: Product) -> None:
+        for field in FIELDS:
+            postings = self._postings[field]
+            for token in tokenize(getattr(product, field)):
+                ids = postings.get(token)
+                if ids is None:
+                    continue
+                ids.discard(product.id)
+                if not ids:
+                    del postings[token]
+                    self._sorted[field] = None
+
+    # Queries ---------------------------------------------------------------
+    def _tokens(self, field: str) -> List[str]:
+        tokens = self._sorted[field]
+        if tokens is None:
+            tokens = self._sorted[field] = sorted(self._postings[field])
+        return tokens
+
+    def prefix_ids(self, prefix: str, fields: Iterable[str] = FIELDS) -> Set[str]:
+        """Ids having a token that starts with ``prefix`` (already folded)."""
+        out: Set[str] = set()
+        for field in fields:
+            postings = self._postings[field]
+            tokens = self._tokens(field)
+            i = bisect_left(tokens, prefix)
+            while i < len(tokens) and tokens[i].startswith(prefix):
+                out |= postings[tokens[i]]
+                i += 1
+        return out
+
+    def search(self, query: str, fields: Iterable[str] = FIELDS) -> Set[str]:
+        """Ids matching every token of ``query``, each one as a prefix."""
+        fields = tuple(fields)
+        result: Optional[Set[str]] = None
+        for token in sorted(set(tokenize(query)), key=len, reverse=True):
+            ids = self.prefix_ids(token, fields)
+            result = ids if result is None else result & ids
+            if not result:
+                break
+        return result if result is not None else set()
+
+    def match_any(self, keywords: Iterable[str], fields: Iterable[str] = FIELDS) -> Set[str]:
+        """Ids matching at least one of ``keywords`` (union of prefix lookups)."""
+        fields = tuple(fields)
+        out: Set[str] = set()
+        for keyword in keywords:
+            out |= self.search(keyword, fields)
+        return out
@@ -1,67 +1,120 @@
-import json
-import sqlite3
-import hashlib
+import threading
+import time
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional, Set
 from datetime import date
 
+from .auth import hash_password, needs_rehash, verify_password
 from .models import Product, Look, LookAuthor, User, Order
+from .catalog import ASSETS_PATH, SNAPSHOT_PATH, load_products
+from .indexes import CatalogIndex
+from .search import TextIndex
+from .trending import TrendingEngine
+from .cache import LRUCache
+from .db import Database
+from .migrations import migrate
+from .like_queue import LikeQueue
+from .thumbnails import thumbnails
+
+# Centinela para distinguir "no está en caché" de un None cacheado
+_MISSING = object()
 
 
 class PonsivStore:
-    """Store backed by SQLite for user accounts and likes."""
+    """Store backed by SQLite for user accounts and likes.
+
+    Database access goes through :class:`ponsiv.db.Database`, so the read
+    methods may be called from worker threads. With ``write_behind`` (the
+    default) like toggles are written in batches by a
+    :class:`ponsiv.like_queue.LikeQueue`; call :meth:`close` before exiting.
+    """
 
-    def __init__(self) -> None:
+    def __init__(self, *, write_behind: bool = True) -> None:
         # In-memory collections for products and orders
         self.products: Dict[str, Product] = {}
         self.looks: Dict[str, Look] = {}
         self.orders: List[Order] = []
         self.cart: List[str] = []
+        self.seed_timings: Dict[str, float] = {}
+        # Índices secundarios (categoría, marca, precio) sobre self.products
+        self.index = CatalogIndex()
+        # Índice invertido de texto (título, marca, categoría) para el buscador
+        self.text_index = TextIndex()
 
-        # Database setup
+        # Database setup (las conexiones se abren en el primer uso)
         self.db_path = Path(__file__).resolve().parent / "users.db"
-        self.conn = sqlite3.connect(self.db_path)
-        self.conn.row_factory = sqlite3.Row
-        self._create_tables()
+        self._db: Optional[Database] = None
+        self._db_lock = threading.Lock()
+
+        # Likes por usuario en memoria (dict como conjunto ordenado); se escriben
+        # en la BD al momento o, con write_behind, en lotes desde una cola
+        self.write_behind = write_behind
+        self._like_queue: Optional[LikeQueue] = None
+        self._liked: Dict[int, Dict[str, Optional[float]]] = {}
+        # Espejo en memoria de la tabla like_counts (se carga al primer uso)
+        self._like_counts: Optional[Dict[str, int]] = None
+        self._counts_lock = threading.Lock()
+        # Tendencias con decaimiento temporal (se carga al primer uso)
+        self._trending_engine: Optional[TrendingEngine] = None
+
+        # Cachés LRU de usuarios (id -> User) y de búsquedas email/handle -> id;
+        # también guardan None ("no existe"). Se invalidan al escribir.
+        self._users = LRUCache(256)
+        self._user_ids = LRUCache(1024)
 
         # Logged in user id (None means not authenticated)
-        self.current_user_id: Optional[int] = None
+        self._current_user_id: Optional[int] = None
+
+    @property
+    def current_user_id(self) -> Optional[int]:
+        return self._current_user_id
+
+    @current_user_id.setter
+    def current_user_id(self, user_id: Optional[int]) -> None:
+        """Set the logged in user and preload their likes in a single query."""
+        self._current_user_id = user_id
+        if user_id is not None:
+            self._liked_set(user_id)
 
     # ------------------------------------------------------------------ DB --
-    def _create_tables(self) -> None:
-        with self.conn:
-            self.conn.execute(
-                """
-                CREATE TABLE IF NOT EXISTS users (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    email TEXT UNIQUE NOT NULL,
-                    password_hash TEXT NOT NULL,
-                    name TEXT,
-                    handle TEXT,
-                    avatar_path TEXT
-                )
-                """
-            )
-            self.conn.execute(
-                """
-                CREATE TABLE IF NOT EXISTS likes (
-                    user_id INTEGER NOT NULL,
-                    product_id TEXT NOT NULL,
-                    UNIQUE(user_id, product_id)
-                )
-                """
-            )
-        # Migración suave: añadir columnas si faltan
-        self._ensure_user_column("age", "INTEGER")
-        self._ensure_user_column("city", "TEXT")
-        self._ensure_user_column("sex", "TEXT")
-
-    def _ensure_user_column(self, col: str, sql_type: str) -> None:
-        cur = self.conn.execute("PRAGMA table_info(users)")
-        existing = {row["name"] for row in cur.fetchall()}
-        if col not in existing:
-            with self.conn:
-                self.conn.execute(f"ALTER TABLE users ADD COLUMN {col} {sql_type}")
+    @property
+    def db(self) -> Database:
+        """Connection layer (see :class:`ponsiv.db.Database`), opened and
+        migrated (see :mod:`ponsiv.migrations`) on first access. Safe to use
+        from any thread."""
+        if self._db is None:
+            with self._db_lock:
+                if self._db is None:
+                    db = Database(self.db_path)
+                    migrate(db)
+                    self._db = db
+        return self._db
+
+    def _likes_queue(self) -> LikeQueue:
+        if self._like_queue is None:
+            db = self.db
+            with self._db_lock:
+                if self._like_queue is None:
+                    self._like_queue = LikeQueue(db)
+        return self._like_queue
+
+    def flush_likes(self) -> None:
+        """Write the queued like toggles now (no-op without write-behind)."""
+        if self._like_queue is not None:
+            self._like_queue.flush()
+
+    def close(self) -> None:
+        """Flush queued likes and close every SQLite connection.
+
+        The connections (and the like queue) are reopened on next use.
+        """
+        with self._db_lock:
+            if self._like_queue is not None:
+                self._like_queue.close()
+                self._like_queue = None
+            if self._db is not None:
+                self._db.close()
+                self._db = None
 
     # User management -------------------------------------------------------
     def create_user(
@@ -75,45 +128,84 @@ class PonsivStore:
         city: Optional[str] = None,
         sex: Optional[str] = None,
     ) -> int:
-        password_hash = hashlib.sha256(password.encode()).hexdigest()
+        """Create a user and return its id.
+
+        Hashing the password is slow on purpose; call from a worker thread.
+        """
+        password_hash = hash_password(password)
         # valores por defecto si no vienen
         if not name:
             name = email.split("@")[0]
         if not handle:
             handle = name
 
-        with self.conn:
-            cur = self.conn.execute(
+        with self.db.writer() as conn:
+            cur = conn.execute(
                 """
                 INSERT INTO users (email, password_hash, name, handle, age, city, sex)
                 VALUES (?, ?, ?, ?, ?, ?, ?)
                 """,
                 (email, password_hash, name, handle, age, city, sex),
             )
+        self._invalidate_user(cur.lastrowid, email=email, handle=handle)
         return cur.lastrowid
 
     def authenticate_user(self, email: str, password: str) -> Optional[int]:
-        cur = self.conn.execute("SELECT id, password_hash FROM users WHERE email=?", (email,))
-        row = cur.fetchone()
+        """Return the id of the user if ``password`` is right, else None.
+
+        Legacy SHA-256 hashes are replaced by PBKDF2 on a successful login.
+        Like :meth:`create_user`, this is slow; call from a worker thread.
+        """
+        row = self.db.query_one("SELECT id, password_hash FROM users WHERE email=?", (email,))
         if not row:
             return None
-        password_hash = hashlib.sha256(password.encode()).hexdigest()
-        if row["password_hash"] == password_hash:
-            return row["id"]
-        return None
+        if not verify_password(password, row["password_hash"]):
+            return None
+        if needs_rehash(row["password_hash"]):
+            self.db.execute(
+                "UPDATE users SET password_hash=? WHERE id=?",
+                (hash_password(password), row["id"]),
+            )
+            self._invalidate_user(row["id"])
+        return row["id"]
+
+    def _invalidate_user(self, user_id: int, *, email: Optional[str] = None,
+                         handle: Optional[str] = None) -> None:
+        """Drop cached data about ``user_id`` (and its email/handle lookups)."""
+        self._users.invalidate(user_id)
+        if email is not None:
+            self._user_ids.invalidate(("email", email))
+        if handle is not None:
+            self._user_ids.invalidate(("handle", handle))
+
+    def _lookup_user_id(self, column: str, value: str) -> Optional[int]:
+        key = (column, value)
+        user_id = self._user_ids.get(key, _MISSING)
+        if user_id is _MISSING:
+            row = self.db.query_one(f"SELECT id FROM users WHERE {column}=?", (value,))
+            user_id = row["id"] if row else None
+            self._user_ids.put(key, user_id)
+        return user_id
 
     def get_user_by_email(self, email: str) -> Optional[int]:
-        cur = self.conn.execute("SELECT id FROM users WHERE email=?", (email,))
-        row = cur.fetchone()
-        return row["id"] if row else None
+        return self._lookup_user_id("email", email)
 
     def get_user_by_handle(self, handle: str) -> Optional[int]:
-        cur = self.conn.execute("SELECT id FROM users WHERE handle=?", (handle,))
-        row = cur.fetchone()
-        return row["id"] if row else None
+        return self._lookup_user_id("handle", handle)
 
     def get_user(self, user_id: int) -> Optional[User]:
-        cur = self.conn.execute(
+        user = self._users.get(user_id, _MISSING)
+        if user is _MISSING:
+            user = self._load_user(user_id)
+            self._users.put(user_id, user)
+        return user
+
+    def user_cache_stats(self) -> Dict[str, Dict[str, int]]:
+        """Hit/miss counters of the user record and email/handle caches."""
+        return {"users": self._users.stats(), "lookups": self._user_ids.stats()}
+
+    def _load_user(self, user_id: int) -> Optional[User]:
+        row = self.db.query_one(
             """
             SELECT id, email, password_hash, name, handle, avatar_path,
                    age, city, sex
@@ -121,64 +213,141 @@ class PonsivStore:
             """,
             (user_id,),
         )
-        row = cur.fetchone()
         if row:
             return User(**row)
         return None
 
     def update_user_avatar(self, user_id: int, avatar_path: str) -> None:
-        with self.conn:
-            self.conn.execute(
-                "UPDATE users SET avatar_path=? WHERE id=?", (avatar_path, user_id)
-            )
+        self.db.execute(
+            "UPDATE users SET avatar_path=? WHERE id=?", (avatar_path, user_id)
+        )
+        self._invalidate_user(user_id)
 
     # Likes management ------------------------------------------------------
+    def _liked_set(self, user_id: int) -> Dict[str, Optional[float]]:
+        """Liked product ids of ``user_id`` (-> like timestamp), loaded once per user."""
+        liked = self._liked.get(user_id)
+        if liked is None:
+            rows = self.db.query(
+                "SELECT product_id, created_at FROM likes WHERE user_id=?",
+                (user_id,),
+            )
+            liked = {row["product_id"]: row["created_at"] for row in rows}
+            self._liked[user_id] = liked
+        return liked
+
     def is_product_liked(self, user_id: int, product_id: str) -> bool:
-        cur = self.conn.execute(
-            "SELECT 1 FROM likes WHERE user_id=? AND product_id=?",
-            (user_id, product_id),
-        )
-        return cur.fetchone() is not None
+        return product_id in self._liked_set(user_id)
 
     def toggle_like(self, user_id: int, product_id: str) -> bool:
-        if self.is_product_liked(user_id, product_id):
-            with self.conn:
-                self.conn.execute(
+        liked = self._liked_set(user_id)
+        # Cargar contadores y tendencias antes de escribir: si se cargaran
+        # después, ya incluirían este like y se contaría dos veces
+        counts, trending = self._counts(), self._trending()
+        if product_id in liked:
+            if self.write_behind:
+                self._likes_queue().put(user_id, product_id, None)
+            else:
+                self.db.execute(
                     "DELETE FROM likes WHERE user_id=? AND product_id=?",
                     (user_id, product_id),
                 )
+            created_at = liked.pop(product_id)
+            self._bump_count(counts, product_id, -1)
+            if created_at is not None:
+                trending.remove(product_id, created_at)
             return False
         else:
-            with self.conn:
-                self.conn.execute(
-                    "INSERT OR IGNORE INTO likes (user_id, product_id) VALUES (?, ?)",
-                    (user_id, product_id),
+            now = time.time()
+            if self.write_behind:
+                self._likes_queue().put(user_id, product_id, now)
+            else:
+                self.db.execute(
+                    "INSERT OR IGNORE INTO likes (user_id, product_id, created_at) VALUES (?, ?, ?)",
+                    (user_id, product_id, now),
                 )
+            liked[product_id] = now
+            self._bump_count(counts, product_id, 1)
+            trending.add(product_id, now)
             return True
 
     def get_liked_product_ids(self, user_id: int) -> List[str]:
-        cur = self.conn.execute(
-            "SELECT product_id FROM likes WHERE user_id=?",
-            (user_id,),
-        )
-        return [row["product_id"] for row in cur.fetchall()]
+        return list(self._liked_set(user_id))
 
     # Trending / Like counts ---------------------------------------------------
+    def _counts(self) -> Dict[str, int]:
+        """In-memory mirror of ``like_counts``, loaded once and kept by toggle_like."""
+        counts = self._like_counts
+        if counts is None:
+            with self._counts_lock:
+                if self._like_counts is None:
+                    rows = self.db.query(
+                        "SELECT product_id, count FROM like_counts WHERE count > 0"
+                    )
+                    self._like_counts = {row["product_id"]: int(row["count"]) for row in rows}
+                counts = self._like_counts
+        return counts
+
+    @staticmethod
+    def _bump_count(counts: Dict[str, int], product_id: str, delta: int) -> None:
+        value = counts.get(product_id, 0) + delta
+        if value > 0:
+            counts[product_id] = value
+        else:
+            counts.pop(product_id, None)
+
     def get_like_count(self, product_id: str) -> int:
-        cur = self.conn.execute(
-            "SELECT COUNT(*) AS c FROM likes WHERE product_id=?", (product_id,)
-        )
-        row = cur.fetchone()
-        return int(row["c"] if row and row["c"] is not None else 0)
+        return self._counts().get(product_id, 0)
 
     def get_all_like_counts(self) -> dict[str, int]:
-        cur = self.conn.execute(
-            "SELECT product_id, COUNT(*) AS c FROM likes GROUP BY product_id"
-        )
-        return {row["product_id"]: int(row["c"]) for row in cur.fetchall()}
+        return dict(self._counts())
+
+    def _trending(self) -> TrendingEngine:
+        """Trending engine fed with the likes still inside its horizon."""
+        engine = self._trending_engine
+        if engine is None:
+            with self._counts_lock:
+                if self._trending_engine is None:
+                    engine = TrendingEngine()
+                    # Agregado por tramo y producto en SQLite (una fila por par, no
+                    # por like) leyendo solo el índice idx_likes_created_product
+                    with self.db.reader() as conn:
+                        cur = conn.cursor()
+                        cur.row_factory = None  # tuplas: pueden ser cientos de miles de filas
+                        cur.execute(
+                            """
+                            SELECT product_id, CAST(created_at / ? AS INTEGER) AS bucket,
+                                   COUNT(*) AS n
+                            FROM likes WHERE created_at >= ?
+                            GROUP BY bucket, product_id
+                            """,
+                            (engine.bucket_seconds, time.time() - engine.horizon_seconds),
+                        )
+                        engine.add_buckets(cur)
+                    self._trending_engine = engine
+                engine = self._trending_engine
+        return engine
+
+    def trending_products(self, products: Optional[Iterable[Product]] = None,
+                          k: Optional[int] = None) -> list[Product]:
+        """Top ``k`` of ``products`` (default: whole catalog) by decayed likes.
+
+        Ties, including products with no recent likes, are ordered by
+        all-time likes and then by title, as in :meth:`sort_products_by_likes`.
+        """
+        if products is None:
+            products = self.products.values()
+        by_id = {p.id: p for p in products}
+        counts = self._counts()
+
+        def tiebreak(pid: str) -> tuple:
+            return (counts.get(pid, 0), by_id[pid].title or "")
+
+        ids = self._trending().top_k(len(by_id) if k is None else k, by_id, tiebreak)
+        return [by_id[pid] for pid in ids]
 
     def sort_products_by_likes(self, products):
-        counts = self.get_all_like_counts()
+        counts = self._counts()
         # 1º likes desc, 2º título para desempatar
         return sorted(
             products,
@@ -187,57 +356,93 @@ class PonsivStore:
         )
 
     # ----------------------------------------------------------------- Seed --
-    def load_seed(self) -> None:
-        """Load product data from the ``assets`` directory."""
-        base_path = Path(__file__).resolve().parent.parent / "assets"
-        info_path = base_path / "informacion"
-        image_path = base_path / "prendas"
-        logo_path = base_path / "logos"
-
-        for info_file in sorted(info_path.glob("*.json")):
-            with open(info_file, "r", encoding="utf-8") as fh:
-                data = json.load(fh)
-
-            pid = info_file.stem
-            brand = data.get("marca", "")
-            title = data.get("nombre", pid)
-            price = data.get("precio", 0.0)
-            sizes = data.get("tallas", [])
-            category = data.get("categoria") or None
-
-            image_file = None
-            for ext in (".jpg", ".png"):
-                candidate = image_path / f"{pid}{ext}"
-                if candidate.exists():
-                    image_file = candidate
-                    break
-            images = [str(image_file)] if image_file else []
-
-            logo_file = None
-            for ext in (".png", ".jpg", ".jpeg"):
-                candidate = logo_path / f"{brand}{ext}"
-                if candidate.exists():
-                    logo_file = candidate
-                    break
-
-            product = Product(
-                id=pid,
-                brand=brand,
-                title=title,
-                price=price,
-                sizes=sizes,
-                images=images,
-                logo=str(logo_file) if logo_file else None,
-                category=category,
-            )
+    def load_seed(
+        self,
+        *,
+        use_snapshot: bool = True,
+        workers: int = 0,
+        processes: bool = False,
+        assets_path: Path = ASSETS_PATH,
+        snapshot_path: Path = SNAPSHOT_PATH,
+    ) -> None:
+        """Load product data from the ``assets`` directory.
+
+        By default the catalog snapshot (``ponsiv/catalog.snapshot``) is used
+        so only new or modified JSON files are parsed; pass
+        ``use_snapshot=False`` to always read every file. ``workers`` and
+        ``processes`` select the parallel loader (see
+        :func:`ponsiv.catalog.load_products`). ``assets_path`` and
+        ``snapshot_path`` point to another catalog (e.g. the benchmarks'
+        synthetic one). The seconds spent in each phase are left in
+        ``self.seed_timings``.
+        """
+        snapshot = snapshot_path if use_snapshot else None
+        self.seed_timings = {}
+        for product in load_products(
+            assets_path, snapshot,
+            workers=workers, processes=processes, timings=self.seed_timings,
+        ):
             self.products[product.id] = product
+        self.index.rebuild(self.products.values())
+        self.text_index.rebuild(self.products.values())
+
+    def add_product(self, product: Product) -> None:
+        """Add or replace a product keeping the secondary indexes in sync."""
+        old = self.products.get(product.id)
+        if old is not None:
+            self.index.remove(old)
+            self.text_index.remove(old)
+        self.products[product.id] = product
+        self.index.add(product)
+        self.text_index.add(product)
+
+    def remove_product(self, product_id: str) -> None:
+        product = self.products.pop(product_id, None)
+        if product is not None:
+            self.index.remove(product)
+            self.text_index.remove(product)
 
     def get_categories(self) -> list[str]:
-        return sorted({p.category for p in self.products.values() if p.category})
+        return list(self.index.categories())
 
     def get_products_by_category(self, category: str) -> list[Product]:
-        c = (category or "").lower()
-        return [p for p in self.products.values() if (p.category or "").lower() == c]
+        return [self.products[pid] for pid in self.index.category_ids(category)]
+
+    def get_products_by_brand(self, brand: str) -> list[Product]:
+        return [self.products[pid] for pid in self.index.brand_ids(brand)]
+
+    def get_products_in_price_range(
+        self, min_price: Optional[float] = None, max_price: Optional[float] = None
+    ) -> list[Product]:
+        """Products priced between ``min_price`` and ``max_price`` (inclusive), cheapest first."""
+        return [self.products[pid] for pid in self.index.price_range_ids(min_price, max_price)]
+
+    def search_products(
+        self,
+        query: str = "",
+        *,
+        categories: Optional[Iterable[str]] = None,
+        keywords: Iterable[str] = (),
+    ) -> list[Product]:
+        """Products passing every filter, resolved by intersecting index lookups.
+
+        ``categories`` restricts to those categories, ``keywords`` keeps titles
+        with a word starting with any of them and ``query`` requires each of
+        its words as a prefix of the title, brand or category.
+        """
+        ids: Optional[Set[str]] = None
+        if categories is not None:
+            ids = {pid for c in categories for pid in self.index.category_ids(c)}
+        keywords = tuple(keywords)
+        if keywords:
+            hits = self.text_index.match_any(keywords, fields=("title",))
+            ids = hits if ids is None else ids & hits
+        if query and query.strip():
+            hits = self.text_index.search(query)
+            ids = hits if ids is None else ids & hits
+        if ids is None:
+            return list(self.products.values())
+        return [self.products[pid] for pid in ids]
 
     # Cart management -----------------------------------------------------
     def add_to_cart(self, product_id: str) -> None:
@@ -263,6 +468,70 @@ class PonsivStore:
         return order
 
 
-store = PonsivStore()
-store.load_seed()
+# ---------------------------------------------------------------- Singleton --
+_store: Optional[PonsivStore] = None
+_store_lock = threading.Lock()
+
+
+def get_store() -> PonsivStore:
+    """Return the app-wide store, loading the catalog on first use."""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                instance = PonsivStore()
+                instance.load_seed()
+                _store = instance
+    return _store
+
+
+def _warm_up() -> None:
+    # Catálogo + apertura de la base de datos y migraciones
+    instance = get_store()
+    instance.db
+    # Contadores y tendencias: el primer like desde la UI ya no los lee de la BD
+    instance._counts()
+    instance._trending()
+    # Miniaturas que falten (las tarjetas usan el original mientras tanto)
+    thumbnails.build(src for p in instance.products.values() for src in p.images[:1])
+
+
+def warm_up() -> threading.Thread:
+    """Start loading the catalog, opening the database and building missing
+    thumbnails on a background thread."""
+    thread = threading.Thread(target=_warm_up, name="ponsiv-store-warmup", daemon=True)
+    thread.start()
+    return thread
+
+
+def is_logged_in() -> bool:
+    """Whether someone has logged in, without loading the store.
+
+    Nobody can log in before the store exists, so at startup this never
+    waits for the catalog (unlike ``store.current_user_id``).
+    """
+    return _store is not None and _store.current_user_id is not None
+
+
+def shutdown() -> None:
+    """Flush pending writes and close the store, if it was ever loaded."""
+    if _store is not None:
+        _store.close()
+
+
+class _LazyStore:
+    """Stand-in for the singleton so ``from ponsiv.store import store`` stays cheap."""
+
+    def __getattr__(self, name):
+        return getattr(get_store(), name)
+
+    def __setattr__(self, name, value):
+        setattr(get_store(), name, value)
+
+    def __repr__(self) -> str:
+        state = "loaded" if _store is not None else "not loaded"
+        return f"<lazy PonsivStore ({state})>"
+
+
+store = _LazyStore()
 
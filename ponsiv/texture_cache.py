@@ -0,0 +1,150 @@
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional
+
+from kivy.cache import Cache
+from kivy.loader import Loader
+
+from .thumbnails import thumbnail_for
+
+# Presupuesto por defecto de memoria de texturas (bytes)
+DEFAULT_BUDGET = 64 * 1024 * 1024
+
+TextureCallback = Callable[[object], None]
+
+
+class TextureCache:
+    """App-wide cache of decoded image textures with a byte budget.
+
+    Entries are keyed by (path, target size): the size picks the thumbnail
+    variant (see :func:`ponsiv.thumbnails.thumbnail_for`), so the key is the
+    file actually decoded. Images are decoded by ``kivy.loader.Loader`` on
+    its worker threads; callbacks run on the Kivy thread.
+
+    On-screen widgets :meth:`acquire` a texture (reference count + 1) and
+    :meth:`release` it when they show something else. When the cache holds
+    more than ``budget`` bytes, unreferenced entries are evicted in least
+    recently used order; referenced ones are never evicted, so the budget
+    can be exceeded while they are all on screen.
+    """
+
+    def __init__(self, budget: int = DEFAULT_BUDGET, workers: int = 2) -> None:
+        self.budget = budget
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()  # key -> (texture, bytes)
+        self._refs: Dict[str, int] = {}
+        self._waiting: Dict[str, List[TextureCallback]] = {}
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        Loader.num_workers = workers
+
+    @staticmethod
+    def key(path: str, width: Optional[float] = None) -> str:
+        return thumbnail_for(path, width) if width else path
+
+    # Referencias -----------------------------------------------------------
+    def acquire(self, path: str, width: Optional[float],
+                callback: TextureCallback) -> Optional[str]:
+        """Pin the texture of ``path`` drawn ``width`` px wide and pass it to
+        ``callback`` (right away if cached). Returns the key to release."""
+        if not path:
+            return None
+        key = self.key(path, width)
+        self._refs[key] = self._refs.get(key, 0) + 1
+        self._get(key, callback)
+        return key
+
+    def release(self, key: Optional[str]) -> None:
+        if key is None or key not in self._refs:
+            return
+        refs = self._refs[key] - 1
+        if refs:
+            self._refs[key] = refs
+        else:
+            del self._refs[key]
+            self._evict()
+
+    def prefetch(self, path: str, width: Optional[float] = None) -> None:
+        """Decode ``path`` in the background without pinning it."""
+        if path:
+            self._get(self.key(path, width), None)
+
+    # Carga -----------------------------------------------------------------
+    def _get(self, key: str, callback: Optional[TextureCallback]) -> None:
+        entry = self._entries.get(key)
+        if entry is not None:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            if callback is not None:
+                callback(entry[0])
+            return
+        waiting = self._waiting.get(key)
+        if waiting is not None:
+            # Ya se está decodificando: se avisa a todos cuando llegue
+            if callback is not None:
+                waiting.append(callback)
+            return
+        self.misses += 1
+        self._waiting[key] = [callback] if callback is not None else []
+        proxy = Loader.image(key)
+        if proxy.loaded:
+            self._store(key, proxy)
+            return
+
+        def _loaded(p):
+            p.unbind(on_load=_loaded, on_error=_failed)
+            self._store(key, p)
+
+        def _failed(p, *_):
+            p.unbind(on_load=_loaded, on_error=_failed)
+            self._waiting.pop(key, None)
+            Cache.remove("kv.loader", key)
+
+        proxy.bind(on_load=_loaded, on_error=_failed)
+
+    def _store(self, key: str, proxy) -> None:
+        texture = proxy.texture
+        # La copia de Kivy se suelta: el presupuesto solo cuenta si esta es la única
+        Cache.remove("kv.loader", key)
+        nbytes = texture.width * texture.height * 4
+        self._entries[key] = (texture, nbytes)
+        self.bytes += nbytes
+        for callback in self._waiting.pop(key, ()):
+            callback(texture)
+        self._evict()
+
+    def _evict(self) -> None:
+        if self.bytes <= self.budget:
+            return
+        for key in list(self._entries):
+            if self.bytes <= self.budget:
+                break
+            if key in self._refs:
+                continue
+            _texture, nbytes = self._entries.pop(key)
+            self.bytes -= nbytes
+            self.evictions += 1
+
+    def clear(self) -> None:
+        """Drop every unreferenced texture."""
+        budget, self.budget = self.budget, 0
+        self._evict()
+        self.budget = budget
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "bytes": self.bytes, "budget": self.budget, "entries": len(self._entries),
+            "pinned": len(self._refs), "hits": self.hits, "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+
+_cache: Optional[TextureCache] = None
+
+
+def texture_cache() -> TextureCache:
+    """App-wide :class:`TextureCache`, created on first use."""
+    global _cache
+    if _cache is None:
+        _cache = TextureCache()
+    return _cache
@@ -0,0 +1,191 @@
+import os
+import json
+import hashlib
+import threading
+import importlib.util
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Tuple
+
+# Pillow es opcional (sin él se usan siempre los originales) y se importa al
+# generar, no al importar este módulo, que se carga con el store
+HAS_PILLOW = importlib.util.find_spec("PIL") is not None
+
+THUMBS_PATH = Path(__file__).resolve().parent / "thumbs"
+
+# Anchos (px) generados por imagen; se sirve el menor que cubra lo pedido
+WIDTH_BUCKETS = (160, 320, 480, 720)
+JPEG_QUALITY = 85
+
+# Sube este número si cambia el formato del manifiesto
+MANIFEST_VERSION = 1
+
+
+def _make_variants(source: str, cache_dir: str,
+                   buckets: Tuple[int, ...]) -> Tuple[str, str, int, Dict[int, str]]:
+    """Worker: hash ``source`` and write its missing width variants.
+
+    Files are named ``<content hash>_<width>.<ext>``, so identical images
+    share their thumbnails and an edited image never reuses stale ones.
+    Returns ``(source, digest, original width, {width: path})``.
+    """
+    from PIL import Image
+
+    with open(source, "rb") as fh:
+        digest = hashlib.sha1(fh.read()).hexdigest()
+    variants: Dict[int, str] = {}
+    with Image.open(source) as img:
+        width, height = img.size
+        has_alpha = img.mode in ("RGBA", "LA", "P")
+        ext = "png" if has_alpha else "jpg"
+        # No se amplía: para anchos mayores que el original vale el original
+        sizes = [b for b in buckets if b < width]
+        missing = [b for b in sizes
+                   if not os.path.exists(os.path.join(cache_dir, f"{digest}_{b}.{ext}"))]
+        if missing:
+            # JPEG: decodifica ya reducido (escalado DCT) al mayor tamaño necesario
+            img.draft("RGB", (max(missing), round(height * max(missing) / width)))
+            current = img.convert("RGBA" if has_alpha else "RGB")
+            # De mayor a menor, cada variante sale de la anterior
+            for bucket in sorted(missing, reverse=True):
+                current = current.resize((bucket, max(1, round(height * bucket / width))),
+                                         Image.LANCZOS)
+                path = os.path.join(cache_dir, f"{digest}_{bucket}.{ext}")
+                tmp = f"{path}.{threading.get_ident()}.tmp"
+                if has_alpha:
+                    current.save(tmp, "PNG")
+                else:
+                    current.save(tmp, "JPEG", quality=JPEG_QUALITY)
+                os.replace(tmp, path)
+        for bucket in sizes:
+            variants[bucket] = os.path.join(cache_dir, f"{digest}_{bucket}.{ext}")
+    return source, digest, width, variants
+
+
+class ThumbnailCache:
+    """On-disk cache of width-bucketed derivatives of the product images.
+
+    :meth:`build` generates the missing variants on a thread pool (Pillow
+    releases the GIL while decoding and resizing) and records them in
+    ``manifest.json`` together with each source's mtime and size, so later
+    launches skip unchanged images. :meth:`resolve` maps an image and the
+    width it will be drawn at to the smallest adequate variant, or to the
+    original while none exists (or without Pillow).
+    """
+
+    def __init__(self, cache_dir: Path = THUMBS_PATH,
+                 buckets: Tuple[int, ...] = WIDTH_BUCKETS) -> None:
+        self.cache_dir = Path(cache_dir)
+        self.buckets = tuple(sorted(buckets))
+        self._manifest: Optional[Dict[str, dict]] = None
+        self._lock = threading.Lock()
+        self._build_lock = threading.Lock()
+
+    @property
+    def available(self) -> bool:
+        return HAS_PILLOW
+
+    # Manifiesto ------------------------------------------------------------
+    @property
+    def manifest_path(self) -> Path:
+        return self.cache_dir / "manifest.json"
+
+    def _entries(self) -> Dict[str, dict]:
+        if self._manifest is None:
+            with self._lock:
+                if self._manifest is None:
+                    self._manifest = self._read_manifest()
+        return self._manifest
+
+    def _read_manifest(self) -> Dict[str, dict]:
+        try:
+            with open(self.manifest_path, "r", encoding="utf-8") as fh:
+                data = json.load(fh)
+        except (OSError, ValueError):
+            return {}
+        if data.get("version") != MANIFEST_VERSION or data.get("buckets") != list(self.buckets):
+            return {}
+        return data.get("entries", {})
+
+    def _write_manifest(self, entries: Dict[str, dict]) -> None:
+        tmp = self.manifest_path.with_suffix(".tmp")
+        try:
+            with open(tmp, "w", encoding="utf-8") as fh:
+                json.dump({"version": MANIFEST_VERSION, "buckets": list(self.buckets),
+                           "entries": entries}, fh)
+            os.replace(tmp, self.manifest_path)
+        except OSError:
+            pass
+
+    # Generación ------------------------------------------------------------
+    def _is_current(self, entry: Optional[dict], stat: os.stat_result) -> bool:
+        return (
+            entry is not None
+            and entry["mtime_ns"] == stat.st_mtime_ns
+            and entry["size"] == stat.st_size
+            and all(os.path.exists(p) for p in entry["variants"].values())
+        )
+
+    def build(self, sources: Iterable[str], *, workers: Optional[int] = None) -> int:
+        """Generate the missing variants of ``sources``; return how many images were processed."""
+        if not self.available:
+            return 0
+        with self._build_lock:
+            entries = self._entries()
+            todo: Dict[str, os.stat_result] = {}
+            for source in dict.fromkeys(s for s in sources if s):
+                try:
+                    stat = os.stat(source)
+                except OSError:
+                    continue
+                if not self._is_current(entries.get(source), stat):
+                    todo[source] = stat
+            if not todo:
+                return 0
+
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            workers = workers or min(4, os.cpu_count() or 1)
+            updated = dict(entries)
+            # Hilos y no procesos: un proceso hijo volvería a ejecutar el módulo
+            # principal (y abriría otra ventana de Kivy)
+            with ThreadPoolExecutor(max_workers=min(workers, len(todo)),
+                                    thread_name_prefix="ponsiv-thumbs") as pool:
+                futures = [pool.submit(_make_variants, s, str(self.cache_dir), self.buckets)
+                           for s in todo]
+                for future in futures:
+                    try:
+                        source, digest, width, variants = future.result()
+                    except Exception:
+                        continue  # imagen ilegible: se seguirá usando el original
+                    stat = todo[source]
+                    updated[source] = {
+                        "mtime_ns": stat.st_mtime_ns, "size": stat.st_size,
+                        "digest": digest, "width": width,
+                        "variants": {str(w): p for w, p in variants.items()},
+                    }
+            with self._lock:
+                self._manifest = updated
+            self._write_manifest(updated)
+            return len(todo)
+
+    # Consulta --------------------------------------------------------------
+    def resolve(self, source: str, width: float) -> str:
+        """Smallest cached variant of ``source`` at least ``width`` px wide."""
+        if not source:
+            return source
+        entry = self._entries().get(source)
+        if entry is None:
+            return source
+        variants = entry["variants"]
+        for bucket in self.buckets:
+            if bucket >= width and str(bucket) in variants:
+                return variants[str(bucket)]
+        return source
+
+
+thumbnails = ThumbnailCache()
+
+
+def thumbnail_for(source: str, width: float) -> str:
+    """Image path to draw ``source`` at ``width`` pixels (see :class:`ThumbnailCache`)."""
+    return thumbnails.resolve(source, width)
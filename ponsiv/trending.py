@@ -0,0 +1,132 @@
+import math
+import heapq
+import threading
+import time
+from typing import Callable, Dict, Iterable, List, Optional
+
+DAY = 86400.0
+
+
+class TrendingEngine:
+    """Time-decayed like scores with top-K queries.
+
+    Every like weighs ``2 ** (-age / half_life)``. Likes are counted in
+    ``bucket_seconds`` buckets and each bucket is weighted at its midpoint,
+    so a like and its later removal always cancel out exactly. Scores use
+    forward decay: they are stored relative to a fixed ``landmark`` time, so
+    the ranking never needs to be recomputed as time passes (every score
+    decays by the same factor). Buckets older than ``horizon`` half-lives
+    are expired and their weight subtracted.
+    """
+
+    def __init__(self, half_life: float = 3 * DAY, bucket_seconds: float = 3600.0,
+                 horizon: float = 8.0) -> None:
+        self.half_life = half_life
+        self.bucket_seconds = bucket_seconds
+        self.horizon_seconds = horizon * half_life
+        self._landmark = time.time()
+        self._buckets: Dict[int, Dict[str, int]] = {}
+        self._scores: Dict[str, float] = {}
+        self._expired_until = -math.inf
+        self._lock = threading.Lock()
+
+    # Updates ---------------------------------------------------------------
+    def _weight(self, bucket: int) -> float:
+        midpoint = (bucket + 0.5) * self.bucket_seconds
+        return 2.0 ** ((midpoint - self._landmark) / self.half_life)
+
+    def add(self, product_id: str, timestamp: float, delta: int = 1) -> None:
+        """Record ``delta`` likes (negative to undo) made at ``timestamp``."""
+        if timestamp < time.time() - self.horizon_seconds:
+            return
+        bucket = int(timestamp // self.bucket_seconds)
+        with self._lock:
+            weight = self._weight(bucket)
+            counts = self._buckets.setdefault(bucket, {})
+            new = counts.get(product_id, 0) + delta
+            if new < 0:
+                # Deshacer un like que ya había caducado o no se registró
+                delta -= new
+                new = 0
+            if new:
+                counts[product_id] = new
+            else:
+                counts.pop(product_id, None)
+            self._apply(product_id, delta * weight)
+            if weight > 2.0 ** 512:
+                self._rebase()
+
+    def add_buckets(self, rows: Iterable[tuple]) -> None:
+        """Record pre-aggregated ``(product_id, bucket, count)`` rows, where
+        ``bucket`` is ``int(timestamp // bucket_seconds)`` (e.g. from a SQL
+        ``GROUP BY``). Much faster than one :meth:`add` per like."""
+        with self._lock:
+            weights: Dict[int, float] = {}
+            for product_id, bucket, count in rows:
+                weight = weights.get(bucket)
+                if weight is None:
+                    weight = weights[bucket] = self._weight(bucket)
+                counts = self._buckets.setdefault(bucket, {})
+                counts[product_id] = counts.get(product_id, 0) + count
+                self._scores[product_id] = self._scores.get(product_id, 0.0) + count * weight
+            if weights and max(weights.values()) > 2.0 ** 512:
+                self._rebase()
+
+    def remove(self, product_id: str, timestamp: float) -> None:
+        self.add(product_id, timestamp, -1)
+
+    def _apply(self, product_id: str, amount: float) -> None:
+        score = self._scores.get(product_id, 0.0) + amount
+        # Evita residuos de coma flotante tras sumar y restar pesos
+        if score > 1e-9 * self._weight(int(self._landmark // self.bucket_seconds)):
+            self._scores[product_id] = score
+        else:
+            self._scores.pop(product_id, None)
+
+    def _rebase(self) -> None:
+        """Move the landmark to now so the forward-decay weights stay finite."""
+        now = time.time()
+        factor = 2.0 ** (-(now - self._landmark) / self.half_life)
+        self._landmark = now
+        self._scores = {pid: s * factor for pid, s in self._scores.items()}
+
+    def expire(self, now: Optional[float] = None) -> None:
+        """Drop buckets older than the horizon and subtract their weight."""
+        now = time.time() if now is None else now
+        cutoff = int((now - self.horizon_seconds) // self.bucket_seconds)
+        with self._lock:
+            for bucket in [b for b in self._buckets if b < cutoff]:
+                weight = self._weight(bucket)
+                for pid, count in self._buckets.pop(bucket).items():
+                    self._apply(pid, -count * weight)
+            self._expired_until = now
+
+    # Queries ---------------------------------------------------------------
+    def score(self, product_id: str, now: Optional[float] = None) -> float:
+        """Decayed number of likes of ``product_id`` as of ``now``."""
+        now = time.time() if now is None else now
+        raw = self._scores.get(product_id, 0.0)
+        return raw * 2.0 ** (-(now - self._landmark) / self.half_life)
+
+    def top_k(
+        self,
+        k: int,
+        candidates: Optional[Iterable[str]] = None,
+        tiebreak: Optional[Callable[[str], tuple]] = None,
+    ) -> List[str]:
+        """The ``k`` ids with the highest score, among ``candidates`` if given.
+
+        Uses a bounded heap (``heapq.nlargest``), O(n log k). ``tiebreak``
+        adds secondary sort keys for ids with equal score.
+        """
+        if time.time() - self._expired_until > self.bucket_seconds:
+            self.expire()
+        with self._lock:
+            scores = self._scores
+            if candidates is None:
+                candidates = list(scores)
+            if tiebreak is None:
+                return heapq.nlargest(k, candidates, key=lambda pid: scores.get(pid, 0.0))
+            return heapq.nlargest(
+                k, candidates, key=lambda pid: (scores.get(pid, 0.0),) + tiebreak(pid)
+            )